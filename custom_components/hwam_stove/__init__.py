@@ -10,15 +10,28 @@ import logging
 
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry, ConfigEntryNotReady
 from homeassistant.const import CONF_HOST, CONF_MONITORED_VARIABLES, CONF_NAME, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import config_validation as cv, issue_registry as ir
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_registry as er,
+    issue_registry as ir,
+)
 from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
 
-from pystove import Stove
-
-from .const import DATA_STOVES, DOMAIN
+from .cache import (
+    async_cache_coordinator,
+    async_destroy_cached_coordinator,
+    async_pop_cached_coordinator,
+)
+from .config_flow import MONITORABLE_KEYS
+from .const import DATA_CACHE, DATA_STOVES, DOMAIN
 from .coordinator import StoveCoordinator
+from .journal import AlarmJournal
+from .proxy import StoveDataView
+from .services import async_setup_services
+from .trace import RecordingStove
+from .websocket_api import async_setup_websocket_api
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -55,25 +68,57 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up the HWAM Stove component from a config entry."""
     if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {DATA_STOVES: {}}
+        hass.data[DOMAIN] = {DATA_CACHE: {}, DATA_STOVES: {}}
 
-    try:
-        stove = await Stove.create(config_entry.data[CONF_HOST])
-    except (CancelledError, TimeoutError) as e:
-        raise ConfigEntryNotReady() from e
+    if (previous := await async_pop_cached_coordinator(hass, config_entry)) is None:
+        try:
+            stove = await RecordingStove.create(config_entry.data[CONF_HOST])
+        except (CancelledError, TimeoutError) as e:
+            raise ConfigEntryNotReady() from e
+    else:
+        stove = previous.stove
 
     stove_hub = StoveCoordinator(hass, stove, config_entry)
     hass.data[DOMAIN][DATA_STOVES][config_entry.entry_id] = stove_hub
 
-    await stove_hub.async_config_entry_first_refresh()
+    if previous is None:
+        await stove_hub.alarm_journal.async_load()
+    if previous is None or not stove_hub.async_take_over(previous):
+        await stove_hub.async_config_entry_first_refresh()
+
+    _async_remove_unmonitored_entities(hass, config_entry, stove_hub)
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    config_entry.async_on_unload(config_entry.add_update_listener(options_updated))
+
     return True
 
 
+@callback
+def _async_remove_unmonitored_entities(
+    hass: HomeAssistant, config_entry: ConfigEntry, stove_hub: StoveCoordinator
+) -> None:
+    """Remove registered entities that are no longer monitored."""
+    entry_id = config_entry.entry_id
+    ent_reg = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(ent_reg, entry_id):
+        key = entity_entry.unique_id.removeprefix(f"{entry_id}-")
+        if not stove_hub.is_monitored(key):
+            ent_reg.async_remove(entity_entry.entity_id)
+
+
+async def options_updated(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Reload the config entry after its options were updated."""
+    await hass.config_entries.async_reload(config_entry.entry_id)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the HWAM Stove component."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    hass.http.register_view(StoveDataView())
+
     if DOMAIN in config:
         ir.async_create_issue(
             hass,
@@ -94,22 +139,60 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     DOMAIN, context={"source": SOURCE_IMPORT}, data=device_config
                 )
             )
+    elif DOMAIN in config:
+        _async_migrate_monitored_variables(hass, config[DOMAIN])
     return True
 
 
+@callback
+def _async_migrate_monitored_variables(
+    hass: HomeAssistant, conf: dict[str, dict]
+) -> None:
+    """Copy monitored variables from YAML to previously imported entries."""
+    yaml_by_host = {
+        device_config[CONF_HOST]: [
+            key
+            for key in device_config[CONF_MONITORED_VARIABLES]
+            if key in MONITORABLE_KEYS
+        ]
+        for device_config in conf.values()
+    }
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if CONF_MONITORED_VARIABLES in entry.options:
+            continue
+        if (monitored := yaml_by_host.get(entry.data[CONF_HOST])) is None:
+            continue
+        hass.config_entries.async_update_entry(
+            entry,
+            options={**entry.options, CONF_MONITORED_VARIABLES: monitored},
+        )
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload the HWAM Stove component from a config entry."""
 
     if unload_ok := await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     ):
-        stove_hub = hass.data[DOMAIN][DATA_STOVES][config_entry.entry_id]
-        await stove_hub.stove.destroy()
-
-        hass.data[DOMAIN][DATA_STOVES].pop(config_entry.entry_id)
-        if hass.data[DOMAIN][DATA_STOVES] == {}:
-            hass.data[DOMAIN].pop(DATA_STOVES)
-            # DATA_STOVES is the only key in hass.data[DOMAIN] at the moment...
-            hass.data.pop(DOMAIN)
+        stove_hub = hass.data[DOMAIN][DATA_STOVES].pop(config_entry.entry_id)
+        await stove_hub.async_stop_capture()
+        # A replay would put its stove back on the cached coordinator.
+        await stove_hub.async_stop_replay()
+        await stove_hub.async_shutdown()
+        # Keep the connection in case the entry is being reloaded.
+        async_cache_coordinator(hass, stove_hub)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Close the cached connection and remove the alarm journal of an entry."""
+    journal = AlarmJournal(hass, config_entry.entry_id)
+    if DOMAIN in hass.data and (
+        coordinator := await async_destroy_cached_coordinator(
+            hass, config_entry.entry_id
+        )
+    ):
+        # Its store may have a pending save that would recreate the file.
+        journal = coordinator.alarm_journal
+    await journal.async_remove()
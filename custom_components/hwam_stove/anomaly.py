@@ -0,0 +1,138 @@
+"""Early warnings from the HWAM Stove telemetry."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from pystove import pystove
+
+WARNING_OVERHEAT = "overheat"
+WARNING_STALLED_BURN = "stalled_burn"
+WARNING_VALVE_PROBLEM = "valve_problem"
+
+# Samples further apart than this restart the statistics.
+MAX_SAMPLE_GAP = 300
+
+# Temperature the stove is not expected to reach during a normal burn.
+OVERHEAT_TEMPERATURE = 400
+# Minutes ahead over which the stove temperature trend is projected.
+OVERHEAT_HORIZON = 5
+
+# A burn is stalling when the temperature keeps falling with plenty of oxygen.
+STALL_RATE = -3.0
+STALL_OXYGEN_LEVEL = 17
+
+# A valve position deviating this many standard deviations from its recent
+# mean is unexpected, with the deviation at least VALVE_MIN_STD percent.
+VALVE_DEVIATION = 4
+VALVE_MIN_STD = 10
+# The valves move to new positions when the phase changes, so their
+# statistics restart and jumps are not checked for this many samples.
+VALVE_SETTLE_SAMPLES = 3
+
+BURN_PHASES = set(pystove.PHASE[1:4])
+VALVE_KEYS = (
+    pystove.DATA_VALVE1_POSITION,
+    pystove.DATA_VALVE2_POSITION,
+    pystove.DATA_VALVE3_POSITION,
+)
+
+
+class RunningStatistics:
+    """Exponentially weighted mean, variance and rate of change of a value.
+
+    Each sample costs constant time and memory.
+    """
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        """Initialize the statistics."""
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.mean: float | None = None
+        self.variance = 0.0
+        self.rate = 0.0
+        self._last_time = 0.0
+        self._last_value = 0.0
+
+    @property
+    def std(self) -> float:
+        """Return the standard deviation."""
+        return math.sqrt(self.variance)
+
+    def add(self, time: float, value: float) -> None:
+        """Add a sample, the rate of change is per minute."""
+        if self.mean is None or time - self._last_time > MAX_SAMPLE_GAP:
+            self.reset()
+            self.mean = value
+        elif (elapsed := time - self._last_time) > 0:
+            rate = (value - self._last_value) / elapsed * 60
+            self.rate += self.alpha * (rate - self.rate)
+            diff = value - self.mean
+            self.mean += self.alpha * diff
+            self.variance = (1 - self.alpha) * (
+                self.variance + self.alpha * diff * diff
+            )
+        else:
+            return
+        self._last_time = time
+        self._last_value = value
+
+
+class AnomalyDetector:
+    """Derive early warnings from the trends in the stove data."""
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self.stove_temperature = RunningStatistics()
+        self.oxygen_level = RunningStatistics()
+        self.valves = {key: RunningStatistics(alpha=0.1) for key in VALVE_KEYS}
+        self._phase: str | None = None
+        self._valve_settle_samples = 0
+
+    def update(self, time: float, data: dict[str, Any]) -> list[str]:
+        """Add a stove snapshot and return the active warnings."""
+        warnings = []
+        temperature = data[pystove.DATA_STOVE_TEMPERATURE]
+        self.stove_temperature.add(time, temperature)
+        self.oxygen_level.add(time, data[pystove.DATA_OXYGEN_LEVEL])
+
+        if (
+            temperature + max(self.stove_temperature.rate, 0) * OVERHEAT_HORIZON
+            >= OVERHEAT_TEMPERATURE
+        ):
+            warnings.append(WARNING_OVERHEAT)
+
+        if (
+            data[pystove.DATA_PHASE] in BURN_PHASES
+            and self.stove_temperature.rate <= STALL_RATE
+            and self.oxygen_level.mean >= STALL_OXYGEN_LEVEL
+        ):
+            warnings.append(WARNING_STALLED_BURN)
+
+        if data[pystove.DATA_PHASE] != self._phase:
+            self._phase = data[pystove.DATA_PHASE]
+            self._valve_settle_samples = VALVE_SETTLE_SAMPLES
+            for statistics in self.valves.values():
+                statistics.reset()
+        elif self._valve_settle_samples:
+            self._valve_settle_samples -= 1
+
+        valve_problem = False
+        for key, statistics in self.valves.items():
+            position = data[key]
+            if not 0 <= position <= 100 or (
+                not self._valve_settle_samples
+                and statistics.mean is not None
+                and abs(position - statistics.mean)
+                > VALVE_DEVIATION * max(statistics.std, VALVE_MIN_STD)
+            ):
+                valve_problem = True
+            statistics.add(time, position)
+        if valve_problem:
+            warnings.append(WARNING_VALVE_PROBLEM)
+
+        return warnings
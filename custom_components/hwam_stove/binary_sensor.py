@@ -7,6 +7,7 @@ https://github.com/mvn23/hwam_stove
 
 from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -14,13 +15,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from pystove import pystove
 
-from .const import DATA_STOVES, DOMAIN, StoveDeviceIdentifier
+from .anomaly import WARNING_OVERHEAT, WARNING_STALLED_BURN, WARNING_VALVE_PROBLEM
+from .const import DATA_EARLY_WARNINGS, DATA_STOVES, DOMAIN, StoveDeviceIdentifier
 from .entity import HWAMStoveCoordinatorEntity, HWAMStoveEntityDescription
 
 
@@ -206,6 +208,42 @@ BINARY_SENSOR_LIST_DESCRIPTIONS = [
         device_class=BinarySensorDeviceClass.PROBLEM,
         alarm_str=pystove.SAFETY_ALARMS[13],
     ),
+    # General (any) early warning
+    HWAMStoveBinarySensorListEntityDescription(
+        key=DATA_EARLY_WARNINGS,
+        translation_key="early_warnings",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        value_source_key=DATA_EARLY_WARNINGS,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        alarm_str=None,
+    ),
+    # Stove temperature heading for overheat
+    HWAMStoveBinarySensorListEntityDescription(
+        key=f"{DATA_EARLY_WARNINGS}_{WARNING_OVERHEAT}",
+        translation_key="early_warnings_overheat",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        value_source_key=DATA_EARLY_WARNINGS,
+        device_class=BinarySensorDeviceClass.HEAT,
+        alarm_str=WARNING_OVERHEAT,
+    ),
+    # Fire going out during the burn phase
+    HWAMStoveBinarySensorListEntityDescription(
+        key=f"{DATA_EARLY_WARNINGS}_{WARNING_STALLED_BURN}",
+        translation_key="early_warnings_stalled_burn",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        value_source_key=DATA_EARLY_WARNINGS,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        alarm_str=WARNING_STALLED_BURN,
+    ),
+    # Valve position far outside its recent range
+    HWAMStoveBinarySensorListEntityDescription(
+        key=f"{DATA_EARLY_WARNINGS}_{WARNING_VALVE_PROBLEM}",
+        translation_key="early_warnings_valve_problem",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        value_source_key=DATA_EARLY_WARNINGS,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        alarm_str=WARNING_VALVE_PROBLEM,
+    ),
 ]
 
 _LOGGER = logging.getLogger(__name__)
@@ -224,41 +262,49 @@ async def async_setup_entry(
             entity_description,
         )
         for entity_description in BINARY_SENSOR_DESCRIPTIONS
+        if stove_hub.is_monitored(entity_description.key)
     )
     async_add_entities(
         HwamStoveAlarmSensor(stove_hub, entity_description)
         for entity_description in BINARY_SENSOR_LIST_DESCRIPTIONS
+        if stove_hub.is_monitored(entity_description.key)
     )
 
 
 class HwamStoveBinarySensor(HWAMStoveCoordinatorEntity, BinarySensorEntity):
     """Representation of a HWAM Stove binary sensor."""
 
+    platform_domain = Platform.BINARY_SENSOR
+
     entity_category = EntityCategory.DIAGNOSTIC
     entity_description: HWAMStoveBinarySensorEntityDescription
 
+    def _extract_value(self, data: dict[str, Any]) -> bool:
+        """Compute the binary sensor state from the coordinator data."""
+        return bool(data[self.entity_description.key])
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle status updates from the coordinator."""
-        self._attr_is_on = bool(self.coordinator.data[self.entity_description.key])
-        self.async_write_ha_state()
+    def _apply_value(self, value: bool) -> None:
+        """Apply a new binary sensor state."""
+        self._attr_is_on = value
 
 
 class HwamStoveAlarmSensor(HWAMStoveCoordinatorEntity, BinarySensorEntity):
     """Representation of a HWAM Stove Alarm binary sensor."""
 
+    platform_domain = Platform.BINARY_SENSOR
+
     entity_category = EntityCategory.DIAGNOSTIC
     entity_description: HWAMStoveBinarySensorListEntityDescription
 
+    def _extract_value(self, data: dict[str, Any]) -> bool:
+        """Compute the alarm state from the coordinator data."""
+        alarms = data[self.entity_description.value_source_key]
+        if self.entity_description.alarm_str is None:
+            return alarms != []
+        return self.entity_description.alarm_str in alarms
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle status updates from the component."""
-        self._attr_is_on = (
-            (
-                self.entity_description.alarm_str
-                in self.coordinator.data[self.entity_description.value_source_key]
-            )
-            if self.entity_description.alarm_str is not None
-            else (self.coordinator.data[self.entity_description.value_source_key] != [])
-        )
-        self.async_write_ha_state()
+    def _apply_value(self, value: bool) -> None:
+        """Apply a new alarm state."""
+        self._attr_is_on = value
@@ -0,0 +1,79 @@
+"""Request budget of a HWAM Stove."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+
+from homeassistant.exceptions import HomeAssistantError
+
+
+class RequestBudgetExceeded(HomeAssistantError):
+    """Raised when a request is dropped because too many are queued."""
+
+
+class RequestBudget:
+    """Token bucket limiting the request rate to a stove.
+
+    Up to burst requests pass at once, after which requests are delayed
+    to rate per second. Requests that would queue behind max_queue others
+    are dropped.
+    """
+
+    def __init__(self, rate: float, burst: int, max_queue: int) -> None:
+        """Initialize the budget."""
+        self.rate = rate
+        self.burst = burst
+        self.max_queue = max_queue
+        self.granted = 0
+        self.delayed = 0
+        self.dropped = 0
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._waiting = 0
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of requests that can pass without delay."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def async_acquire(self, drop: bool = True) -> None:
+        """Wait until the budget allows a request.
+
+        Raise RequestBudgetExceeded if drop is set and the queue is full.
+        """
+        if self._waiting == 0 and self.tokens >= 1:
+            self._tokens -= 1
+            self.granted += 1
+            return
+        if drop and self._waiting >= self.max_queue:
+            self.dropped += 1
+            raise RequestBudgetExceeded("Too many stove requests are queued")
+        self._waiting += 1
+        self.delayed += 1
+        try:
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._tokens -= 1
+        finally:
+            self._waiting -= 1
+        self.granted += 1
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the budget usage."""
+        return {
+            "burst": self.burst,
+            "delayed": self.delayed,
+            "dropped": self.dropped,
+            "granted": self.granted,
+            "queued": self._waiting,
+            "rate": self.rate,
+            "tokens": round(self.tokens, 2),
+        }
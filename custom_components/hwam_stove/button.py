@@ -8,7 +8,7 @@ https://github.com/mvn23/hwam_stove
 from collections.abc import Awaitable
 from dataclasses import dataclass
 import logging
-from typing import Any, Callable
+from typing import Callable
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -19,6 +19,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pystove import pystove
 
 from .const import DATA_STOVES, DOMAIN, StoveDeviceIdentifier
+from .coordinator import StoveCoordinator
 from .entity import HWAMStoveBaseEntity, HWAMStoveEntityDescription
 
 
@@ -29,7 +30,7 @@ class HWAMStoveButtonEntityDescription(
 ):
     """Describes a hwam_stove button entity."""
 
-    press_func: Callable[[pystove.Stove], Awaitable[Any]]
+    press_func: Callable[[pystove.Stove], Awaitable[bool]]
 
 
 BUTTON_DESCRIPTIONS = [
@@ -62,11 +63,11 @@ async def async_setup_entry(
     stove_hub = hass.data[DOMAIN][DATA_STOVES][config_entry.entry_id]
     async_add_entities(
         HwamStoveButton(
-            stove_hub.stove,
-            config_entry,
+            stove_hub,
             entity_description,
         )
         for entity_description in BUTTON_DESCRIPTIONS
+        if stove_hub.is_monitored(entity_description.key)
     )
 
 
@@ -75,6 +76,17 @@ class HwamStoveButton(HWAMStoveBaseEntity, ButtonEntity):
 
     entity_description: HWAMStoveButtonEntityDescription
 
+    def __init__(
+        self,
+        stove_coordinator: StoveCoordinator,
+        entity_description: HWAMStoveButtonEntityDescription,
+    ) -> None:
+        """Initialize the button."""
+        super().__init__(stove_coordinator.config_entry, entity_description)
+        self.coordinator = stove_coordinator
+
     async def async_press(self) -> None:
         """Perform the button action."""
-        await self.entity_description.press_func(self.stove)
+        await self.coordinator.async_send_command(
+            lambda: self.entity_description.press_func(self.coordinator.stove)
+        )
@@ -0,0 +1,73 @@
+"""Cache of HWAM Stove coordinators across config entry reloads."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_CACHE, DOMAIN
+from .coordinator import StoveCoordinator
+
+# Seconds a cached stove connection waits for the entry to be set up again.
+CACHE_TIMEOUT = 60
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_cache_coordinator(hass: HomeAssistant, coordinator: StoveCoordinator) -> None:
+    """Keep the coordinator of an unloaded entry for the next setup.
+
+    The stove connection is closed when the entry is not set up again
+    within CACHE_TIMEOUT seconds.
+    """
+    cache = hass.data[DOMAIN][DATA_CACHE]
+    entry_id = coordinator.config_entry.entry_id
+
+    async def expire(_now: datetime) -> None:
+        """Close the connection of an unclaimed coordinator."""
+        if entry_id in cache and cache[entry_id][0] is coordinator:
+            del cache[entry_id]
+            coordinator.async_end_subscriptions()
+            await coordinator.stove.destroy()
+
+    cache[entry_id] = (coordinator, async_call_later(hass, CACHE_TIMEOUT, expire))
+
+
+@callback
+def _async_pop(hass: HomeAssistant, entry_id: str) -> StoveCoordinator | None:
+    """Remove the cached coordinator of an entry and cancel its expiry."""
+    if (cached := hass.data[DOMAIN][DATA_CACHE].pop(entry_id, None)) is None:
+        return None
+    coordinator, cancel_expiry = cached
+    cancel_expiry()
+    return coordinator
+
+
+async def async_pop_cached_coordinator(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> StoveCoordinator | None:
+    """Return the cached coordinator of an entry, if its host is unchanged."""
+    if (coordinator := _async_pop(hass, config_entry.entry_id)) is None:
+        return None
+    if coordinator.stove.stove_host != config_entry.data[CONF_HOST]:
+        coordinator.async_end_subscriptions()
+        await coordinator.stove.destroy()
+        return None
+    _LOGGER.debug("Reusing the connection to stove %s", coordinator.name)
+    return coordinator
+
+
+async def async_destroy_cached_coordinator(
+    hass: HomeAssistant, entry_id: str
+) -> StoveCoordinator | None:
+    """Close the connection of the cached coordinator of an entry, return it."""
+    if (coordinator := _async_pop(hass, entry_id)) is not None:
+        coordinator.async_end_subscriptions()
+        await coordinator.stove.destroy()
+    return coordinator
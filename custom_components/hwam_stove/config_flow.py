@@ -2,15 +2,64 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Any
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_HOST, CONF_MONITORED_VARIABLES, CONF_NAME
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 import voluptuous as vol
 
 from pystove import pystove
 
-from .const import DOMAIN
+from .binary_sensor import BINARY_SENSOR_DESCRIPTIONS, BINARY_SENSOR_LIST_DESCRIPTIONS
+from .button import BUTTON_DESCRIPTIONS
+from .const import (
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_INTERPOLATION_INTERVAL,
+    CONF_POLL_INTERVAL,
+    CONF_RAW_DATA_PROXY,
+    CONF_STOVE_RATING,
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+)
+from .datetime import TIME_DESCRIPTIONS as DATETIME_DESCRIPTIONS
+from .number import NUMBER_DESCRIPTIONS
+from .sensor import (
+    ENERGY_SENSOR_DESCRIPTIONS,
+    ESTIMATE_SENSOR_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+    TOTAL_SENSOR_DESCRIPTIONS,
+)
+from .switch import SWITCH_DESCRIPTIONS
+from .time import TIME_DESCRIPTIONS
+
+MONITORABLE_KEYS = sorted(
+    {
+        description.key
+        for description in (
+            *BINARY_SENSOR_DESCRIPTIONS,
+            *BINARY_SENSOR_LIST_DESCRIPTIONS,
+            *BUTTON_DESCRIPTIONS,
+            *DATETIME_DESCRIPTIONS,
+            *NUMBER_DESCRIPTIONS,
+            *ENERGY_SENSOR_DESCRIPTIONS,
+            *ESTIMATE_SENSOR_DESCRIPTIONS,
+            *SENSOR_DESCRIPTIONS,
+            *SWITCH_DESCRIPTIONS,
+            *TIME_DESCRIPTIONS,
+            *TOTAL_SENSOR_DESCRIPTIONS,
+        )
+    }
+)
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class HWAMStoveConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
@@ -18,6 +67,12 @@ class HWAMStoveConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return HWAMStoveOptionsFlow()
+
     async def async_step_init(
         self, info: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -46,7 +101,9 @@ class HWAMStoveConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
             except ConnectionError:
                 return self._show_form({"base": "cannot_connect"})
 
-            return self._create_entry(name, host)
+            return self._create_entry(
+                name, host, info.get(CONF_MONITORED_VARIABLES, [])
+            )
 
         return self._show_form()
 
@@ -61,9 +118,23 @@ class HWAMStoveConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
 
         This flow is triggered by `async_setup` for configured devices.
         """
+        monitored = [
+            key
+            for key in import_data.get(CONF_MONITORED_VARIABLES, [])
+            if key in MONITORABLE_KEYS
+        ]
+        if ignored := set(import_data.get(CONF_MONITORED_VARIABLES, [])) - set(
+            monitored
+        ):
+            _LOGGER.warning(
+                "Ignoring unknown monitored variables for %s: %s",
+                import_data[CONF_NAME],
+                ", ".join(sorted(ignored)),
+            )
         formatted_config = {
             CONF_NAME: import_data[CONF_NAME],
             CONF_HOST: import_data[CONF_HOST],
+            CONF_MONITORED_VARIABLES: monitored,
         }
         return await self.async_step_init(info=formatted_config)
 
@@ -80,8 +151,69 @@ class HWAMStoveConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
             errors=errors or {},
         )
 
-    def _create_entry(self, name: str, host: str) -> ConfigFlowResult:
+    def _create_entry(
+        self, name: str, host: str, monitored_variables: list[str]
+    ) -> ConfigFlowResult:
         """Create entry for the HWAM Stove."""
         return self.async_create_entry(
-            title=name, data={CONF_HOST: host, CONF_NAME: name}
+            title=name,
+            data={CONF_HOST: host, CONF_NAME: name},
+            options={CONF_MONITORED_VARIABLES: monitored_variables},
+        )
+
+
+class HWAMStoveOptionsFlow(OptionsFlow):
+    """Handle HWAM Stove options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the HWAM Stove options.
+
+        An empty selection monitors everything. A clock drift threshold,
+        interpolation interval or stove rating of 0 disables that feature.
+        """
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_MONITORED_VARIABLES,
+                        default=self.config_entry.options.get(
+                            CONF_MONITORED_VARIABLES, []
+                        ),
+                    ): cv.multi_select(MONITORABLE_KEYS),
+                    vol.Optional(
+                        CONF_CLOCK_DRIFT_THRESHOLD,
+                        default=self.config_entry.options.get(
+                            CONF_CLOCK_DRIFT_THRESHOLD, 0
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_POLL_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_INTERPOLATION_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_INTERPOLATION_INTERVAL, 0
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                    vol.Optional(
+                        CONF_STOVE_RATING,
+                        default=self.config_entry.options.get(CONF_STOVE_RATING, 0),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=30)),
+                    vol.Optional(
+                        CONF_RAW_DATA_PROXY,
+                        default=self.config_entry.options.get(
+                            CONF_RAW_DATA_PROXY, False
+                        ),
+                    ): bool,
+                }
+            ),
         )
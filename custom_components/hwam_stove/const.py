@@ -2,10 +2,63 @@
 
 from enum import StrEnum
 
+ATTR_ALARM = "alarm"
+ATTR_CATEGORY = "category"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_DURATION = "duration"
+ATTR_END = "end"
+ATTR_FILENAME = "filename"
+ATTR_SPEED = "speed"
+ATTR_START = "start"
+
+CONF_CLOCK_DRIFT_THRESHOLD = "clock_drift_threshold"
+CONF_INTERPOLATION_INTERVAL = "interpolation_interval"
+CONF_POLL_INTERVAL = "poll_interval"
+CONF_RAW_DATA_PROXY = "raw_data_proxy"
+CONF_STOVE_RATING = "stove_rating"
+
+DATA_CACHE = "cache"
+DATA_CLOCK_DRIFT = "clock_drift"
+DATA_CONNECT_TIME = "connect_time"
+DATA_DNS_TIME = "dns_time"
+DATA_EARLY_WARNINGS = "early_warnings"
+DATA_FIRST_BYTE_TIME = "first_byte_time"
+DATA_HEAT_ENERGY = "heat_energy"
+DATA_HEAT_OUTPUT = "heat_output"
+DATA_PARSE_TIME = "parse_time"
+DATA_PROFILER = "profiler"
+DATA_ROOM_TEMPERATURE_ESTIMATE = "room_temperature_estimate"
+DATA_ROOM_TEMPERATURE_RESIDUAL = "room_temperature_residual"
+DATA_SEASON_BURN_HOURS = "season_burn_hours"
+DATA_SEASON_IGNITIONS = "season_ignitions"
+DATA_STOVE_TEMPERATURE_ESTIMATE = "stove_temperature_estimate"
+DATA_STOVE_TEMPERATURE_RESIDUAL = "stove_temperature_residual"
+DATA_TRANSFER_TIME = "transfer_time"
+DATA_WOOD_CONSUMPTION = "wood_consumption"
+
 DATA_STOVES = "stoves"
 
+DEFAULT_POLL_INTERVAL = 10
+
 DOMAIN = "hwam_stove"
 
+EVENT_HWAM_STOVE = "hwam_stove_event"
+
+EVENT_TYPE_ALARM_CLEARED = "alarm_cleared"
+EVENT_TYPE_ALARM_RAISED = "alarm_raised"
+EVENT_TYPE_PHASE_CHANGED = "phase_changed"
+EVENT_TYPE_REFILL_NEEDED = "refill_needed"
+
+SERVICE_APPLY_SETTINGS = "apply_settings"
+SERVICE_EXPORT_HISTORY = "export_history"
+SERVICE_GENERATE_REPORT = "generate_report"
+SERVICE_PROFILE = "profile"
+SERVICE_QUERY_ALARMS = "query_alarms"
+SERVICE_REPLAY_TRACE = "replay_trace"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+
 
 class StoveDeviceIdentifier(StrEnum):
     """Device identification strings."""
@@ -1,21 +1,113 @@
 """HWAM Stove Update Coordinator."""
 
-from datetime import timedelta
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timedelta
 import logging
+from math import ceil, inf, log2
+import random
+from time import monotonic, thread_time
 from typing import Any
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_MONITORED_VARIABLES, CONF_NAME, Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from pystove import pystove
 
-from .const import DOMAIN, StoveDeviceIdentifier
+from .anomaly import AnomalyDetector
+from .budget import RequestBudget, RequestBudgetExceeded
+from .const import (
+    CONF_CLOCK_DRIFT_THRESHOLD,
+    CONF_INTERPOLATION_INTERVAL,
+    CONF_POLL_INTERVAL,
+    CONF_RAW_DATA_PROXY,
+    CONF_STOVE_RATING,
+    DATA_CLOCK_DRIFT,
+    DATA_EARLY_WARNINGS,
+    DATA_HEAT_ENERGY,
+    DATA_HEAT_OUTPUT,
+    DATA_ROOM_TEMPERATURE_ESTIMATE,
+    DATA_ROOM_TEMPERATURE_RESIDUAL,
+    DATA_SEASON_BURN_HOURS,
+    DATA_SEASON_IGNITIONS,
+    DATA_STOVE_TEMPERATURE_ESTIMATE,
+    DATA_STOVE_TEMPERATURE_RESIDUAL,
+    DATA_WOOD_CONSUMPTION,
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    EVENT_HWAM_STOVE,
+    EVENT_TYPE_ALARM_CLEARED,
+    EVENT_TYPE_ALARM_RAISED,
+    EVENT_TYPE_PHASE_CHANGED,
+    EVENT_TYPE_REFILL_NEEDED,
+    StoveDeviceIdentifier,
+)
+from .energy import EnergyMeter
+from .estimator import MAX_HORIZON, LinearTrend
+from .journal import JOURNALED_ALARMS, AlarmJournal
+from .metrics import RollingSamples, deep_sizeof
+from .timing import REQUEST_PHASES
+from .trace import RecordingStove, ReplayStove, TraceWriter, async_replay_trace
 
 _LOGGER = logging.getLogger(__name__)
 
+# Consecutive failures after which the stove is considered unreachable.
+FAILURE_THRESHOLD = 3
+BACKOFF_BASE = timedelta(seconds=30)
+BACKOFF_MAX = timedelta(minutes=15)
+# Doublings of BACKOFF_BASE that reach BACKOFF_MAX. Clamping the exponent
+# keeps the backoff from overflowing after many failures.
+BACKOFF_MAX_EXPONENT = ceil(log2(BACKOFF_MAX / BACKOFF_BASE))
+
+POLL_SAMPLES = 100
+ROUND_TRIP_MIN_SAMPLES = 5
+REQUEST_TIMEOUT_DEFAULT = 10.0
+REQUEST_TIMEOUT_FACTOR = 3
+REQUEST_TIMEOUT_MAX = 30.0
+REQUEST_TIMEOUT_MIN = 2.0
+
+# Clock drift is reported in steps, so it does not change on every poll.
+CLOCK_DRIFT_RESOLUTION = 5
+CLOCK_SYNC_MIN_INTERVAL = timedelta(hours=1)
+# Seconds off a stove clock that turned back is, when it restarted after
+# a power loss rather than being synchronized.
+POWER_LOSS_CLOCK_OFFSET = 300
+
+# Known stove events are polled for, so standby needs few other polls.
+STANDBY_POLL_INTERVAL = timedelta(seconds=120)
+# Delay of the poll after a known stove event, for the stove to switch.
+EVENT_POLL_DELAY = timedelta(seconds=2)
+
+# Request budget of a stove: sustained rate per second, burst and queue size.
+REQUEST_RATE = 1.0
+REQUEST_BURST = 5
+REQUEST_QUEUE = 10
+
+# Values estimated between polls, with the keys of the estimate and residual.
+ESTIMATED_VALUES = {
+    pystove.DATA_ROOM_TEMPERATURE: (
+        DATA_ROOM_TEMPERATURE_ESTIMATE,
+        DATA_ROOM_TEMPERATURE_RESIDUAL,
+    ),
+    pystove.DATA_STOVE_TEMPERATURE: (
+        DATA_STOVE_TEMPERATURE_ESTIMATE,
+        DATA_STOVE_TEMPERATURE_RESIDUAL,
+    ),
+}
+
+# Energy values are published at most once per interval.
+ENERGY_PUBLISH_INTERVAL = 60
+ENERGY_VALUES = (DATA_HEAT_ENERGY, DATA_HEAT_OUTPUT, DATA_WOOD_CONSUMPTION)
+
 
 class StoveCoordinator(DataUpdateCoordinator):
     """Abstract description of a stove coordinator."""
@@ -33,12 +125,97 @@ class StoveCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=f"HWAM Stove {config_entry.data[CONF_NAME]}",
-            update_interval=timedelta(seconds=10),
+            update_interval=timedelta(
+                seconds=config_entry.options.get(
+                    CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
+                )
+            ),
             always_update=False,
         )
         self.hass = hass
+        self.config_entry = config_entry
         self.name = config_entry.data[CONF_NAME]
         self.stove = stove
+        self.monitored_variables: set[str] = set(
+            config_entry.options.get(CONF_MONITORED_VARIABLES, [])
+        )
+        self.clock_drift_threshold: int = config_entry.options.get(
+            CONF_CLOCK_DRIFT_THRESHOLD, 0
+        )
+        self._last_clock_sync: datetime | None = None
+        self.raw_data_proxy: bool = config_entry.options.get(CONF_RAW_DATA_PROXY, False)
+        self.poll_interval = self.update_interval
+        self.trends: dict[str, LinearTrend] = {}
+        if interpolation_interval := config_entry.options.get(
+            CONF_INTERPOLATION_INTERVAL, 0
+        ):
+            # Estimates extrapolate up to the next poll at most.
+            max_horizon = min(self.poll_interval.total_seconds(), MAX_HORIZON)
+            self.trends = {
+                key: LinearTrend(max_horizon=max_horizon) for key in ESTIMATED_VALUES
+            }
+            config_entry.async_on_unload(
+                async_track_time_interval(
+                    hass,
+                    self._async_publish_estimates,
+                    timedelta(seconds=interpolation_interval),
+                )
+            )
+        self.anomaly_detector = AnomalyDetector()
+        self._replay_anomaly_detector: AnomalyDetector | None = None
+        self._live_data: dict[str, Any] | None = None
+        self.replay_task: asyncio.Task[int] | None = None
+        self.energy_meter: EnergyMeter | None = None
+        if stove_rating := config_entry.options.get(CONF_STOVE_RATING, 0):
+            self.energy_meter = EnergyMeter(stove_rating)
+        self._energy_published: float | None = None
+        self.report_summary: dict[str, Any] = {
+            DATA_SEASON_BURN_HOURS: None,
+            DATA_SEASON_IGNITIONS: None,
+        }
+        self.alarm_journal = AlarmJournal(hass, config_entry.entry_id)
+        self.values: dict[str, Any] = {}
+        self._value_extractors: dict[str, Callable[[dict[str, Any]], Any]] = {}
+        self._listeners_available: bool | None = None
+        self._failures = 0
+        self._last_poll_start: float | None = None
+        self._expected_interval: float | None = None
+        self.round_trips = RollingSamples(POLL_SAMPLES)
+        self.poll_jitter = RollingSamples(POLL_SAMPLES)
+        self.dispatch_times = RollingSamples(POLL_SAMPLES)
+        self.command_round_trips = RollingSamples(POLL_SAMPLES)
+        self.command_latency = RollingSamples(POLL_SAMPLES)
+        self._command_lock = asyncio.Lock()
+        self.budget = RequestBudget(REQUEST_RATE, REQUEST_BURST, REQUEST_QUEUE)
+        self._poll: asyncio.Task[tuple[dict[str, Any], float, bool]] | None = None
+        self.coalesced_polls = 0
+        self._unconfirmed_commands: deque[float] = deque(maxlen=POLL_SAMPLES)
+        # Settings written by entities awaiting confirmation by a poll:
+        # value, command, time the command was sent (inf until then) and the
+        # data the command updates.
+        self.desired_settings: dict[
+            str,
+            tuple[Any, Callable[[], Awaitable[bool]], float, dict[str, Any] | None],
+        ] = {}
+        # Confirmed settings, with the command and data updates to restore
+        # them after an outage.
+        self.applied_settings: dict[
+            str, tuple[Any, Callable[[], Awaitable[bool]], dict[str, Any] | None]
+        ] = {}
+        # Start of the poll that produced the current data.
+        self._data_poll_start: float | None = None
+        self.skipped_commands = 0
+        self.reapplied_settings = 0
+        self.listener_updates = 0
+        self.statistics_start = monotonic()
+        self._requested_intervals: dict[object, timedelta] = {}
+        # Websocket subscriptions, moved to the coordinator of a reload.
+        self._subscriptions: dict[
+            object, Callable[[StoveCoordinator | None], None]
+        ] = {}
+        self._event_poll: tuple[datetime, CALLBACK_TYPE] | None = None
+        self.event_polls = 0
+        self._cycle_listeners: dict[object, CALLBACK_TYPE] = {}
 
         dev_reg = dr.async_get(hass)
         self.stove_device_entry = dev_reg.async_get_or_create(
@@ -58,15 +235,935 @@ class StoveCoordinator(DataUpdateCoordinator):
             translation_key="hwam_remote_device",
         )
 
+    @callback
+    def async_take_over(self, previous: "StoveCoordinator") -> bool:
+        """Take over the state of the coordinator of a reloaded entry.
+
+        Return whether the previous data was reused. It is not when the
+        last poll failed or new options add values it lacks.
+        """
+        self.alarm_journal = previous.alarm_journal
+        self.anomaly_detector = previous.anomaly_detector
+        self.applied_settings = previous.applied_settings
+        self.budget = previous.budget
+        self.coalesced_polls = previous.coalesced_polls
+        self.command_latency = previous.command_latency
+        self.command_round_trips = previous.command_round_trips
+        self.desired_settings = previous.desired_settings
+        self.dispatch_times = previous.dispatch_times
+        self.event_polls = previous.event_polls
+        self.listener_updates = previous.listener_updates
+        self.poll_jitter = previous.poll_jitter
+        self.reapplied_settings = previous.reapplied_settings
+        self.report_summary = previous.report_summary
+        self.round_trips = previous.round_trips
+        self.skipped_commands = previous.skipped_commands
+        self.statistics_start = previous.statistics_start
+        self._data_poll_start = previous._data_poll_start
+        self._failures = previous._failures
+        self._last_clock_sync = previous._last_clock_sync
+        self._live_data = previous._live_data
+        if self.trends and previous.trends:
+            self.trends = previous.trends
+        if self.energy_meter is not None and previous.energy_meter is not None:
+            previous.energy_meter.rating = self.energy_meter.rating
+            self.energy_meter = previous.energy_meter
+            self._energy_published = previous._energy_published
+        subscriptions, previous._subscriptions = previous._subscriptions, {}
+        for rebind in subscriptions.values():
+            rebind(self)
+
+        if (
+            previous.data is None
+            or not previous.last_update_success
+            or (self.trends and not previous.trends)
+            or (self.energy_meter is not None and previous.energy_meter is None)
+        ):
+            return False
+        self.async_set_updated_data(previous.data)
+        return True
+
+    async def async_shutdown(self) -> None:
+        """Cancel the poll after the next stove event and shut down."""
+        self._async_cancel_event_poll()
+        await super().async_shutdown()
+
+    def is_monitored(self, key: str) -> bool:
+        """Return whether entities for key should be created.
+
+        An empty selection monitors everything.
+        """
+        return not self.monitored_variables or key in self.monitored_variables
+
+    async def async_start_capture(self, path: str) -> None:
+        """Start appending raw stove responses to a trace file."""
+        if not isinstance(self.stove, RecordingStove):
+            raise TypeError("Stove does not support capturing")
+        await self.async_stop_capture()
+        writer = TraceWriter(self.hass, path)
+        await writer.async_open()
+        self.stove.recorder = writer
+
+    async def async_stop_capture(self) -> None:
+        """Stop capturing raw stove responses."""
+        if not isinstance(self.stove, RecordingStove) or self.stove.recorder is None:
+            return
+        writer, self.stove.recorder = self.stove.recorder, None
+        await writer.async_close()
+
+    @callback
+    def async_start_replay(self, path: str, speed: float) -> None:
+        """Replay a trace file in the background, one at a time."""
+        if self.replay_task is not None:
+            raise HomeAssistantError(f"Stove {self.name} is already replaying")
+        self.replay_task = self.hass.async_create_background_task(
+            async_replay_trace(self.hass, self, path, speed),
+            f"hwam_stove replay {path}",
+        )
+
+        @callback
+        def replay_done(_task: asyncio.Task[int]) -> None:
+            """Allow the next replay."""
+            self.replay_task = None
+
+        self.replay_task.add_done_callback(replay_done)
+
+    async def async_stop_replay(self) -> None:
+        """Cancel a running replay and wait until the stove is restored."""
+        if self.replay_task is not None:
+            self.replay_task.cancel()
+            await asyncio.wait([self.replay_task])
+
+    async def async_apply_settings(self, settings: dict[str, Any]) -> None:
+        """Apply several stove settings and confirm them with one refresh.
+
+        Settings are compared with their pending write, or else with the
+        current data, and only those that differ are sent, in a fixed
+        order. Like the writes of entities, the settings are kept to be
+        re-applied after an outage. The refresh also follows a batch cut
+        short by the request budget.
+        """
+        data = self.data
+        begin_key = pystove.DATA_NIGHT_BEGIN_TIME
+        end_key = pystove.DATA_NIGHT_END_TIME
+        # Entity platform, current value and command of each setting.
+        setters: dict[
+            str, tuple[Platform, Any, Callable[[Any], Callable[[], Awaitable[bool]]]]
+        ] = {
+            pystove.DATA_BURN_LEVEL: (
+                Platform.NUMBER,
+                data[pystove.DATA_BURN_LEVEL],
+                lambda value: lambda: self.stove.set_burn_level(value),
+            ),
+            begin_key: (
+                Platform.TIME,
+                data[begin_key],
+                lambda value: lambda: self.stove.set_night_lowering_hours(
+                    start=value, end=self.data.get(end_key)
+                ),
+            ),
+            end_key: (
+                Platform.TIME,
+                data[end_key],
+                lambda value: lambda: self.stove.set_night_lowering_hours(
+                    start=self.data.get(begin_key), end=value
+                ),
+            ),
+            pystove.DATA_NIGHT_LOWERING: (
+                Platform.SWITCH,
+                data[pystove.DATA_NIGHT_LOWERING] != pystove.NIGHT_LOWERING_STATES[0],
+                lambda value: lambda: self.stove.set_night_lowering(value),
+            ),
+            pystove.DATA_REMOTE_REFILL_ALARM: (
+                Platform.SWITCH,
+                bool(data[pystove.DATA_REMOTE_REFILL_ALARM]),
+                lambda value: lambda: self.stove.set_remote_refill_alarm(value),
+            ),
+        }
+
+        targets: dict[str, Any] = {}
+        pending: list[tuple[str, list[str], Callable[[], Awaitable[bool]]]] = []
+        for key, (platform, current, setter) in setters.items():
+            value_key = f"{platform}.{key}"
+            written = monotonic()
+            if (previous := self.desired_settings.get(value_key)) is not None:
+                current, written = previous[0], previous[2]
+            targets[key] = value = settings.get(key, current)
+            if key not in settings:
+                continue
+            self.applied_settings.pop(value_key, None)
+            self.desired_settings[value_key] = (
+                value,
+                setter(value),
+                written if value == current else inf,
+                {key: value} if platform == Platform.TIME else None,
+            )
+            if value == current:
+                continue
+            if platform != Platform.TIME:
+                pending.append((key, [value_key], self.desired_settings[value_key][1]))
+            elif pending and pending[-1][0] == "night_lowering_hours":
+                pending[-1][1].append(value_key)
+            else:
+                # Both night lowering hours are sent in one request.
+                pending.append(
+                    (
+                        "night_lowering_hours",
+                        [value_key],
+                        lambda: self.stove.set_night_lowering_hours(
+                            start=targets[begin_key], end=targets[end_key]
+                        ),
+                    )
+                )
+        if not pending:
+            return
+
+        failed: list[str] = []
+        try:
+            for name, value_keys, command in pending:
+                if not await self._async_run_command(
+                    self._dated_command(value_keys, command)
+                ):
+                    failed.append(name)
+        finally:
+            self._date_settings(
+                value_key for _, value_keys, _ in pending for value_key in value_keys
+            )
+            await self.async_refresh()
+        if failed:
+            raise HomeAssistantError(
+                f"Stove {self.name} did not accept: {', '.join(failed)}"
+            )
+
+    async def async_send_command(
+        self,
+        command: Callable[[], Awaitable[bool]],
+        updates: dict[str, Any] | None = None,
+    ) -> bool:
+        """Send a command to the stove and request a refresh to confirm it.
+
+        On success, updates are applied to a copy of the current data, so
+        commands that are queued behind this one build on its result while
+        readers of the previous data keep an unchanged view.
+        """
+        if not await self._async_run_command(command):
+            return False
+        if updates and self.data is not None:
+            self.data = {**self.data, **updates}
+        await self.async_request_refresh()
+        return True
+
+    async def async_write_setting(
+        self,
+        key: str,
+        value: Any,
+        command: Callable[[], Awaitable[bool]],
+        updates: dict[str, Any] | None = None,
+    ) -> bool:
+        """Make the stove follow a setting, unless it already does.
+
+        key is the value key of the entity writing the setting, and value
+        is compared with the value extracted for it. The write is
+        skipped when the current data shows it and no earlier write of
+        the setting awaits confirmation. The setting is re-applied when
+        the stove lost it during an outage, e.g. a power cut.
+        """
+        self.applied_settings.pop(key, None)
+        previous = self.desired_settings.get(key)
+        self.desired_settings[key] = (value, command, inf, updates)
+        if (
+            self.data is not None
+            and (extractor := self._value_extractors.get(key)) is not None
+            and extractor(self.data) == value
+            and (
+                previous is None
+                or (
+                    self._data_poll_start is not None
+                    and previous[2] < self._data_poll_start
+                )
+            )
+        ):
+            self._date_settings([key])
+            self.skipped_commands += 1
+            return True
+        try:
+            return await self.async_send_command(
+                self._dated_command([key], command), updates
+            )
+        finally:
+            self._date_settings([key])
+
+    def _dated_command(
+        self, keys: list[str], command: Callable[[], Awaitable[bool]]
+    ) -> Callable[[], Awaitable[bool]]:
+        """Return command, dating the writes of the settings keys once sent.
+
+        Polls that start before a write is sent cannot confirm it, even
+        when they start after the write was queued.
+        """
+
+        async def dated_command() -> bool:
+            """Date the writes and send the command."""
+            self._date_settings(keys)
+            return await command()
+
+        return dated_command
+
+    @callback
+    def _date_settings(self, keys: Iterable[str]) -> None:
+        """Date the writes of settings keys that were not sent yet."""
+        now = monotonic()
+        for key in keys:
+            if (desired := self.desired_settings.get(key)) is None:
+                continue
+            value, command, written, updates = desired
+            if written == inf:
+                self.desired_settings[key] = (value, command, now, updates)
+
+    def _stove_lost_power(self, data: dict[str, Any]) -> bool:
+        """Return whether the stove clock restarted since the previous poll.
+
+        The clock of a stove that lost power starts over. Synchronizing
+        the clock may also turn it back, but only to the current time.
+        """
+        if self.data is None:
+            return False
+        stove_time: datetime = data[pystove.DATA_DATE_TIME]
+        now = dt_util.now().replace(tzinfo=None)
+        return (
+            stove_time < self.data[pystove.DATA_DATE_TIME]
+            and abs((stove_time - now).total_seconds()) > POWER_LOSS_CLOCK_OFFSET
+        )
+
+    @callback
+    def _reconcile_settings(
+        self, data: dict[str, Any], poll_start: float, outage: bool
+    ) -> None:
+        """Compare the written and applied settings with the polled data.
+
+        Written settings the data shows are confirmed and kept as applied.
+        After an outage, settings the stove lost are re-applied. Otherwise
+        a setting that changed was changed at the stove itself, which then
+        takes precedence. Re-applied settings update the data as their
+        first write did, so commands that send several settings at once,
+        like the night lowering hours, build on each other.
+        """
+        lost: list[
+            tuple[str, Any, Callable[[], Awaitable[bool]], dict[str, Any] | None]
+        ] = []
+        for key, (value, command, written, updates) in list(
+            self.desired_settings.items()
+        ):
+            if (
+                written >= poll_start
+                or (extractor := self._value_extractors.get(key)) is None
+            ):
+                continue
+            del self.desired_settings[key]
+            if extractor(data) == value:
+                self.applied_settings[key] = (value, command, updates)
+            elif outage:
+                lost.append((key, value, command, updates))
+        for key, (value, command, updates) in list(self.applied_settings.items()):
+            if (extractor := self._value_extractors.get(key)) is None or extractor(
+                data
+            ) == value:
+                continue
+            del self.applied_settings[key]
+            if outage:
+                lost.append((key, value, command, updates))
+
+        for key, value, command, updates in lost:
+            _LOGGER.info("Re-applying %s to stove %s", key, self.name)
+            self.reapplied_settings += 1
+            self.desired_settings[key] = (value, command, inf, updates)
+            self.hass.async_create_task(
+                self._async_reapply_setting(key, command, updates)
+            )
+
+    async def _async_reapply_setting(
+        self,
+        key: str,
+        command: Callable[[], Awaitable[bool]],
+        updates: dict[str, Any] | None,
+    ) -> None:
+        """Send a setting the stove lost again."""
+        try:
+            success = await self.async_send_command(
+                self._dated_command([key], command), updates
+            )
+        except RequestBudgetExceeded:
+            success = False
+        finally:
+            self._date_settings([key])
+        if not success:
+            _LOGGER.warning("Stove %s did not accept %s again", self.name, key)
+
+    async def _async_acquire_budget(self, drop: bool = True) -> None:
+        """Wait for the request budget, which replayed traces do not use."""
+        if not self.replaying:
+            await self.budget.async_acquire(drop)
+
+    async def _async_run_command(self, command: Callable[[], Awaitable[bool]]) -> bool:
+        """Run a command in order with other commands and polls.
+
+        A command that does not complete within the request timeout fails,
+        so a stalled stove does not hold up the commands and polls queued
+        behind it. Raise RequestBudgetExceeded when too many requests are
+        queued.
+        """
+        start = monotonic()
+        await self._async_acquire_budget()
+        async with self._command_lock:
+            try:
+                async with asyncio.timeout(self.request_timeout):
+                    success = await command()
+            except TimeoutError:
+                _LOGGER.warning("Stove %s did not answer a command in time", self.name)
+                success = False
+        self.command_round_trips.add(monotonic() - start)
+        if success:
+            self._unconfirmed_commands.append(start)
+        return success
+
+    @callback
+    def async_request_update_interval(self, interval: timedelta) -> CALLBACK_TYPE:
+        """Poll at least every interval until the returned callback is called."""
+        token = object()
+        self._requested_intervals[token] = interval
+        if not self.circuit_open and self.update_interval > interval:
+            self.update_interval = interval
+
+        @callback
+        def remove_request() -> None:
+            """Remove the requested update interval."""
+            self._requested_intervals.pop(token, None)
+
+        return remove_request
+
+    @callback
+    def async_add_subscription(
+        self, rebind: Callable[["StoveCoordinator | None"], None]
+    ) -> CALLBACK_TYPE:
+        """Register a subscription that outlives reloads of the entry.
+
+        rebind is called with the coordinator of the reloaded entry, or
+        with None when the entry is not set up again.
+        """
+        token = object()
+        self._subscriptions[token] = rebind
+
+        @callback
+        def remove_subscription() -> None:
+            """Remove the subscription."""
+            self._subscriptions.pop(token, None)
+
+        return remove_subscription
+
+    @callback
+    def async_add_cycle_listener(self, listener: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call listener after every update cycle, also when it failed.
+
+        Unlike coordinator listeners, cycle listeners are not called for
+        updates published between polls or by commands.
+        """
+        token = object()
+        self._cycle_listeners[token] = listener
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the cycle listener."""
+            self._cycle_listeners.pop(token, None)
+
+        return remove_listener
+
+    @callback
+    def async_end_subscriptions(self) -> None:
+        """End the subscriptions of an entry that is not set up again."""
+        subscriptions, self._subscriptions = self._subscriptions, {}
+        for rebind in subscriptions.values():
+            rebind(None)
+
+    @callback
+    def async_add_value_extractor(
+        self, key: str, extractor: Callable[[dict[str, Any]], Any]
+    ) -> CALLBACK_TYPE:
+        """Register a function computing the value for key from the data.
+
+        key identifies the entity the value is for, and is the context of
+        its listener.
+        """
+        self._value_extractors[key] = extractor
+        if self.data is not None:
+            self.values[key] = extractor(self.data)
+
+        @callback
+        def remove_extractor() -> None:
+            """Remove the value extractor, unless it was replaced."""
+            if self._value_extractors.get(key) is extractor:
+                del self._value_extractors[key]
+                self.values.pop(key, None)
+
+        return remove_extractor
+
+    @callback
+    def async_invalidate_value(self, key: str) -> None:
+        """Forget the cached value for key, so the next update is dispatched."""
+        self.values.pop(key, None)
+
+    @callback
+    def async_extract_values(self) -> set[str]:
+        """Compute all registered values in one pass, return the changed keys."""
+        changed: set[str] = set()
+        if self.data is None:
+            return changed
+
+        data = self.data
+        values = self.values
+        for key, extractor in self._value_extractors.items():
+            value = extractor(data)
+            if key not in values or values[key] != value:
+                values[key] = value
+                changed.add(key)
+        return changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose value changed.
+
+        Listeners without a context, and all listeners after a change in
+        availability, are always updated.
+        """
+        start = thread_time()
+        changed = self.async_extract_values()
+        update_all = self._listeners_available != self.last_update_success
+        self._listeners_available = self.last_update_success
+        for update_callback, context in list(self._listeners.values()):
+            if update_all or context is None or context in changed:
+                update_callback()
+                self.listener_updates += 1
+        self.dispatch_times.add(thread_time() - start)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return poll statistics of the coordinator."""
+        elapsed = monotonic() - self.statistics_start
+        return {
+            "circuit_open": self.circuit_open,
+            "coalesced_polls": self.coalesced_polls,
+            "command_confirmed_seconds": self.command_latency.as_dict(),
+            "command_seconds": self.command_round_trips.as_dict(),
+            "consecutive_failures": self._failures,
+            "dispatch_cpu_seconds": self.dispatch_times.as_dict(),
+            "event_polls": self.event_polls,
+            "next_event": None
+            if self._event_poll is None
+            else self._event_poll[0].isoformat(),
+            "listener_updates": self.listener_updates,
+            "listener_updates_per_second": self.listener_updates / elapsed,
+            "poll_jitter_seconds": self.poll_jitter.as_dict(),
+            "request_budget": self.budget.as_dict(),
+            "request_phase_seconds": self.stove.timer.as_dict()
+            if isinstance(self.stove, RecordingStove) and self.stove.timer is not None
+            else None,
+            "reapplied_settings": self.reapplied_settings,
+            "request_timeout": self.request_timeout,
+            "round_trip_seconds": self.round_trips.as_dict(),
+            "skipped_commands": self.skipped_commands,
+            "value_extractors": len(self._value_extractors),
+        }
+
+    def memory_usage(self) -> dict[str, Any]:
+        """Return the approximate memory used by the stove and its entities.
+
+        Entity descriptions are shared by all stoves and counted apart from
+        the entities, as are the coordinator and stove entities refer to.
+        """
+        entities: list[Entity] = [
+            update_callback.__self__
+            for update_callback, _ in self._listeners.values()
+            if isinstance(getattr(update_callback, "__self__", None), Entity)
+        ]
+        descriptions = [entity.entity_description for entity in entities]
+        entity_bytes = [
+            deep_sizeof(entity, (self, self.stove, *descriptions))
+            for entity in entities
+        ]
+        return {
+            "coordinator_bytes": deep_sizeof(self, (self.stove, *entities)),
+            "descriptions_bytes": deep_sizeof(descriptions),
+            "entities": len(entities),
+            "entity_bytes": sum(entity_bytes),
+            "entity_bytes_max": max(entity_bytes, default=None),
+            "snapshot_bytes": deep_sizeof(self.data),
+            "stove_bytes": deep_sizeof(self.stove),
+        }
+
+    @property
+    def replaying(self) -> bool:
+        """Return whether a trace is replayed instead of polling the stove."""
+        return isinstance(self.stove, ReplayStove)
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return whether the stove is considered unreachable."""
+        return self._failures >= FAILURE_THRESHOLD
+
+    @property
+    def request_timeout(self) -> float:
+        """Return a request timeout based on the measured round trip times."""
+        if len(self.round_trips) < ROUND_TRIP_MIN_SAMPLES:
+            return REQUEST_TIMEOUT_DEFAULT
+        p95 = self.round_trips.percentile(95)
+        return max(
+            REQUEST_TIMEOUT_MIN, min(p95 * REQUEST_TIMEOUT_FACTOR, REQUEST_TIMEOUT_MAX)
+        )
+
+    def _record_failure(self, message: str) -> UpdateFailed:
+        """Register a failed update and back off if the stove is unreachable."""
+        self._failures += 1
+        if self._failures == FAILURE_THRESHOLD:
+            _LOGGER.warning(
+                "Stove %s is unreachable, backing off until it responds again",
+                self.name,
+            )
+        if self.circuit_open:
+            backoff = min(
+                BACKOFF_BASE
+                * 2 ** min(self._failures - FAILURE_THRESHOLD, BACKOFF_MAX_EXPONENT),
+                BACKOFF_MAX,
+            )
+            # Equal jitter keeps probes of several stoves from synchronizing.
+            self.update_interval = backoff / 2 + backoff / 2 * random.random()
+            _LOGGER.debug(
+                "Next probe of stove %s in %s", self.name, self.update_interval
+            )
+        self._expected_interval = self.update_interval.total_seconds()
+        return UpdateFailed(message)
+
+    def _fire_transition_events(self, old: dict[str, Any], new: dict[str, Any]) -> None:
+        """Fire an event for each phase change, alarm change and refill request.
+
+        Early warnings are reported as alarms too.
+        """
+
+        def fire(event_type: str, **event_data: Any) -> None:
+            self.hass.bus.async_fire(
+                EVENT_HWAM_STOVE,
+                {
+                    "config_entry_id": self.config_entry.entry_id,
+                    "device_id": self.stove_device_entry.id,
+                    "type": event_type,
+                    **event_data,
+                },
+            )
+
+        if old[pystove.DATA_PHASE] != new[pystove.DATA_PHASE]:
+            fire(
+                EVENT_TYPE_PHASE_CHANGED,
+                old=old[pystove.DATA_PHASE],
+                new=new[pystove.DATA_PHASE],
+            )
+
+        for key in (
+            pystove.DATA_MAINTENANCE_ALARMS,
+            pystove.DATA_SAFETY_ALARMS,
+            DATA_EARLY_WARNINGS,
+        ):
+            old_alarms = set(old[key])
+            new_alarms = set(new[key])
+            for alarm in sorted(new_alarms - old_alarms):
+                fire(EVENT_TYPE_ALARM_RAISED, category=key, alarm=alarm)
+            for alarm in sorted(old_alarms - new_alarms):
+                fire(EVENT_TYPE_ALARM_CLEARED, category=key, alarm=alarm)
+
+        if new[pystove.DATA_REFILL_ALARM] and not old[pystove.DATA_REFILL_ALARM]:
+            fire(EVENT_TYPE_REFILL_NEEDED)
+
+    def _update_trends(self, data: dict[str, Any]) -> None:
+        """Add the polled values to their trends and store the estimates.
+
+        Trends are reset when the phase changes, so each phase gets a
+        fit of its own.
+        """
+        now = monotonic()
+        if self.data is not None and (
+            self.data[pystove.DATA_PHASE] != data[pystove.DATA_PHASE]
+        ):
+            for trend in self.trends.values():
+                trend.reset()
+        for key, trend in self.trends.items():
+            trend.add(now, data[key])
+            estimate_key, residual_key = ESTIMATED_VALUES[key]
+            data[estimate_key] = round(trend.estimate(now), 1)
+            data[residual_key] = (
+                None if trend.residual is None else round(trend.residual, 2)
+            )
+
+    @staticmethod
+    def _next_stove_event(data: dict[str, Any]) -> datetime | None:
+        """Return the stove time of the next state change the stove announced.
+
+        These are the start and end of night lowering when it is enabled.
+        The new firewood estimate is no event: it moves with every poll
+        while the stove burns, and would reschedule the poll every time.
+        """
+        now = data[pystove.DATA_DATE_TIME]
+        events = []
+        if data[pystove.DATA_NIGHT_LOWERING] != pystove.NIGHT_LOWERING_STATES[0]:
+            for key in (pystove.DATA_NIGHT_BEGIN_TIME, pystove.DATA_NIGHT_END_TIME):
+                event = datetime.combine(now.date(), data[key])
+                if event <= now:
+                    event += timedelta(days=1)
+                events.append(event)
+        return min(events, default=None)
+
+    @callback
+    def _async_schedule_event_poll(self, data: dict[str, Any]) -> None:
+        """Poll just after the next stove event, besides the regular polls.
+
+        Event times follow the stove clock, so clock drift does not delay
+        the poll.
+        """
+        event = self._next_stove_event(data)
+        if self._event_poll is not None and self._event_poll[0] == event:
+            return
+        self._async_cancel_event_poll()
+        if event is None:
+            return
+
+        async def poll(_now: datetime) -> None:
+            """Poll the stove after its event."""
+            self._event_poll = None
+            if not self.circuit_open:
+                self.event_polls += 1
+                await self.async_refresh()
+
+        self._event_poll = (
+            event,
+            async_call_later(
+                self.hass,
+                event - data[pystove.DATA_DATE_TIME] + EVENT_POLL_DELAY,
+                poll,
+            ),
+        )
+
+    @callback
+    def _async_cancel_event_poll(self) -> None:
+        """Cancel the poll after the next stove event."""
+        if self._event_poll is not None:
+            self._event_poll[1]()
+            self._event_poll = None
+
+    def _request_phase_times(self) -> dict[str, float | None]:
+        """Return the percentiles of the request phases of the stove."""
+        if isinstance(self.stove, RecordingStove) and self.stove.timer is not None:
+            return self.stove.timer.percentiles()
+        return dict.fromkeys(REQUEST_PHASES)
+
+    def _update_energy(self, data: dict[str, Any]) -> None:
+        """Integrate the heat output and publish the totals when due.
+
+        Replayed heat was already counted, so the totals, which are
+        persisted, are left as they are.
+        """
+        if self.replaying:
+            data[DATA_HEAT_OUTPUT] = round(self.energy_meter.estimate_power(data), 2)
+            for key, total in self.energy_meter.totals.items():
+                data[key] = round(total, 3)
+            return
+        now = monotonic()
+        self.energy_meter.add(now, data)
+        if (
+            self.data is not None
+            and self._energy_published is not None
+            and now - self._energy_published < ENERGY_PUBLISH_INTERVAL
+        ):
+            for key in ENERGY_VALUES:
+                data[key] = self.data[key]
+            return
+        self._energy_published = now
+        data[DATA_HEAT_OUTPUT] = round(self.energy_meter.power, 2)
+        for key, total in self.energy_meter.totals.items():
+            data[key] = round(total, 3)
+
+    @callback
+    def async_set_report(self, report: dict[str, Any]) -> None:
+        """Publish the summary of a burn report."""
+        self.report_summary = {
+            DATA_SEASON_BURN_HOURS: report["burn_hours"],
+            DATA_SEASON_IGNITIONS: report["ignitions"],
+        }
+        if self.data is not None:
+            self.data.update(self.report_summary)
+            self.async_update_listeners()
+
+    @callback
+    def async_restore_total(self, key: str, value: float) -> None:
+        """Add an energy total saved before a restart to the meter."""
+        self.energy_meter.restore(key, value)
+        if self.data is not None:
+            self.data[key] = round(self.energy_meter.totals[key], 3)
+
+    @callback
+    def _async_publish_estimates(self, _now: datetime) -> None:
+        """Update the estimated values between polls."""
+        if self.data is None or not self.last_update_success:
+            return
+        now = monotonic()
+        for key, trend in self.trends.items():
+            if (estimate := trend.estimate(now)) is not None:
+                self.data[ESTIMATED_VALUES[key][0]] = round(estimate, 1)
+        self.async_update_listeners()
+
+    def _check_clock_drift(self, stove_time: datetime) -> int:
+        """Return the stove clock drift and sync the clock if it is too large.
+
+        The stove clock has no time zone and follows local time. The drift
+        is rounded to CLOCK_DRIFT_RESOLUTION seconds.
+        """
+        now = dt_util.now().replace(tzinfo=None)
+        drift = (stove_time - now).total_seconds()
+        if (
+            self.clock_drift_threshold
+            and abs(drift) > self.clock_drift_threshold
+            and (
+                self._last_clock_sync is None
+                or now - self._last_clock_sync > CLOCK_SYNC_MIN_INTERVAL
+            )
+        ):
+            _LOGGER.info(
+                "Clock of stove %s is %d seconds off, synchronizing", self.name, drift
+            )
+            self._last_clock_sync = now
+            self.hass.async_create_task(
+                self.async_send_command(lambda: self.stove.set_time(now))
+            )
+        return round(drift / CLOCK_DRIFT_RESOLUTION) * CLOCK_DRIFT_RESOLUTION
+
     async def _async_update_data(self) -> dict[str, Any]:
-        """Update stove info."""
-        data = await self.stove.get_data()
+        """Update stove info, sharing one poll between concurrent refreshes.
+
+        The settings are reconciled with the data and the start of the
+        poll is recorded as the data is returned, so both always belong to
+        the data the base class stores. Until then, writes compare with
+        the previous data and its start, which only skips fewer writes.
+        """
+        try:
+            if self._poll is not None:
+                self.coalesced_polls += 1
+                return (await asyncio.shield(self._poll))[0]
+            self._poll = self.hass.async_create_task(self._async_poll())
+            try:
+                data, start, outage = await asyncio.shield(self._poll)
+            finally:
+                self._poll = None
+            # Replayed settings were confirmed back then, not by the stove now.
+            if not self.replaying:
+                self._reconcile_settings(data, start, outage)
+                self._data_poll_start = start
+            return data
+        finally:
+            for listener in list(self._cycle_listeners.values()):
+                listener()
+
+    async def _async_poll(self) -> tuple[dict[str, Any], float, bool]:
+        """Poll the stove and derive the values of the integration.
+
+        Return the data, the start of the poll and whether it ended an
+        outage.
+        """
+        start = monotonic()
+        if self.replaying:
+            # Replayed polls follow the replay speed and take no round trip.
+            self._last_poll_start = None
+        else:
+            if (
+                self._last_poll_start is not None
+                and self._expected_interval is not None
+            ):
+                self.poll_jitter.add(
+                    abs(start - self._last_poll_start - self._expected_interval)
+                )
+            self._last_poll_start = start
+        # Commands sent before this poll are confirmed by its data.
+        confirming = len(self._unconfirmed_commands)
+        await self._async_acquire_budget(drop=False)
+        try:
+            async with self._command_lock:
+                request_start = monotonic()
+                async with asyncio.timeout(self.request_timeout):
+                    data = await self.stove.get_data()
+        except (aiohttp.ClientError, KeyError, TimeoutError) as err:
+            raise self._record_failure(
+                f"Error communicating with stove: {err!r}"
+            ) from err
         if data is None:
-            raise UpdateFailed("Got empty response")
+            raise self._record_failure("Got empty response")
+
+        end = monotonic()
+        if not self.replaying:
+            self.round_trips.add(end - request_start)
+        for _ in range(confirming):
+            self.command_latency.add(end - self._unconfirmed_commands.popleft())
+        # Settings may be lost in an outage, not by a single failed poll.
+        outage = self.circuit_open or self._stove_lost_power(data)
+        if self.circuit_open:
+            _LOGGER.info("Stove %s is reachable again", self.name)
+        self._failures = 0
 
-        self.update_interval = timedelta(
-            seconds=10 if data[pystove.DATA_PHASE] != pystove.PHASE[5] else 60
+        self.update_interval = min(
+            [
+                self.poll_interval
+                if data[pystove.DATA_PHASE] != pystove.PHASE[5]
+                else max(self.poll_interval, STANDBY_POLL_INTERVAL),
+                *self._requested_intervals.values(),
+            ]
         )
+        self._expected_interval = self.update_interval.total_seconds()
+        # Replayed traces do not follow the stove clock.
+        if not self.replaying:
+            self._async_schedule_event_poll(data)
+
+        # A replayed stove clock cannot be compared with the current time,
+        # nor synchronized.
+        data[DATA_CLOCK_DRIFT] = (
+            None
+            if self.replaying
+            else self._check_clock_drift(data[pystove.DATA_DATE_TIME])
+        )
+
+        # Replayed samples are judged apart at their recorded times, leaving
+        # the statistics of the stove itself untouched.
+        if not self.replaying:
+            data[DATA_EARLY_WARNINGS] = self.anomaly_detector.update(monotonic(), data)
+            self._replay_anomaly_detector = None
+        else:
+            if self._replay_anomaly_detector is None:
+                self._replay_anomaly_detector = AnomalyDetector()
+            data[DATA_EARLY_WARNINGS] = self._replay_anomaly_detector.update(
+                self.stove.timestamp, data
+            )
+        data.update(self._request_phase_times())
+        data.update(self.report_summary)
+
+        if self.trends:
+            self._update_trends(data)
+
+        if self.energy_meter is not None:
+            self._update_energy(data)
+
+        # Replayed transitions did not happen now, so no events are fired
+        # and live data is compared with the last live data.
+        if not self.replaying:
+            if self._live_data is not None:
+                self._fire_transition_events(self._live_data, data)
+            self._live_data = data
+
+        # Replayed alarms did not happen now, so they are not journaled.
+        if not self.replaying:
+            timestamp = dt_util.utcnow().timestamp()
+            for key in JOURNALED_ALARMS:
+                self.alarm_journal.async_update(timestamp, key, data[key])
 
         dev_reg = dr.async_get(self.hass)
         dev_reg.async_update_device(
@@ -78,4 +1175,4 @@ class StoveCoordinator(DataUpdateCoordinator):
             self.remote_device_entry.id,
             sw_version=data.get(pystove.DATA_REMOTE_VERSION),
         )
-        return data
+        return data, start, outage
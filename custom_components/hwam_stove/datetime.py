@@ -13,7 +13,7 @@ from typing import Any, Callable
 
 from homeassistant.components.datetime import DateTimeEntity, DateTimeEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util.dt import get_default_time_zone
@@ -32,7 +32,7 @@ class HWAMStoveDateTimeEntityDescription(
 ):
     """Describes a hwam_stove datetime entity."""
 
-    set_func: Callable[[StoveCoordinator, datetime], Awaitable[Any]]
+    set_func: Callable[[StoveCoordinator, datetime], Awaitable[bool]]
 
 
 TIME_DESCRIPTIONS = [
@@ -61,25 +61,33 @@ async def async_setup_entry(
             description,
         )
         for description in TIME_DESCRIPTIONS
+        if stove_device.is_monitored(description.key)
     )
 
 
 class HwamStoveTime(HWAMStoveCoordinatorEntity, DateTimeEntity):
     """Representation of a HWAM Stove datetime entity."""
 
+    platform_domain = Platform.DATETIME
+
     entity_category = EntityCategory.CONFIG
     entity_description: HWAMStoveDateTimeEntityDescription
     _attr_native_value: datetime | None = None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle status updates from the component."""
-        naive_dt: datetime = self.coordinator.data[self.entity_description.key]
-        self._attr_native_value = datetime.combine(
+    def _extract_value(self, data: dict[str, Any]) -> datetime:
+        """Compute the datetime value from the coordinator data."""
+        naive_dt: datetime = data[self.entity_description.key]
+        return datetime.combine(
             naive_dt.date(), naive_dt.time(), get_default_time_zone()
         )
-        self.async_write_ha_state()
+
+    @callback
+    def _apply_value(self, value: datetime | None) -> None:
+        """Apply a new datetime value."""
+        self._attr_native_value = value
 
     async def async_set_value(self, value: datetime) -> None:
         """Update the time value on the stove."""
-        await self.entity_description.set_func(self.coordinator, value)
+        await self.coordinator.async_send_command(
+            lambda: self.entity_description.set_func(self.coordinator, value)
+        )
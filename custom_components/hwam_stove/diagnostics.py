@@ -0,0 +1,34 @@
+"""Diagnostics support for HWAM Stove."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_STOVES, DOMAIN
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    stove_hub = hass.data[DOMAIN][DATA_STOVES][config_entry.entry_id]
+    return {
+        "config_entry": {
+            "data": async_redact_data(dict(config_entry.data), TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "stove": {
+            "series": stove_hub.stove.series,
+            "algorithm_version": stove_hub.stove.algo_version,
+        },
+        "coordinator": stove_hub.as_dict(),
+        "alarm_journal": stove_hub.alarm_journal.as_dict(),
+        "memory": stove_hub.memory_usage(),
+    }
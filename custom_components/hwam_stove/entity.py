@@ -1,12 +1,15 @@
 """Common HWAM Stove entity properties."""
 
+from abc import abstractmethod
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity, EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from pystove import Stove
-
 from .const import DOMAIN, StoveDeviceIdentifier
 from .coordinator import StoveCoordinator
 
@@ -22,11 +25,9 @@ class HWAMStoveBaseEntity(Entity):
 
     _attr_has_entity_name = True
     entity_description: HWAMStoveEntityDescription
-    stove: Stove
 
     def __init__(
         self,
-        stove,
         config_entry: ConfigEntry,
         entity_description: HWAMStoveEntityDescription,
     ) -> None:
@@ -42,13 +43,18 @@ class HWAMStoveBaseEntity(Entity):
             }
         )
         self.entity_description = entity_description
-        self.stove = stove
 
 
 class HWAMStoveCoordinatorEntity(
     HWAMStoveBaseEntity, CoordinatorEntity[StoveCoordinator]
 ):
-    """Represent a hwam_stove coordinator entity."""
+    """Represent a hwam_stove coordinator entity.
+
+    Entities of different platforms can share a data key, so values are
+    cached by the coordinator under a key that includes the platform.
+    """
+
+    platform_domain: Platform
 
     def __init__(
         self,
@@ -56,15 +62,35 @@ class HWAMStoveCoordinatorEntity(
         entity_description: HWAMStoveEntityDescription,
     ) -> None:
         """Initialize the entity."""
-        CoordinatorEntity.__init__(self, stove_coordinator)
+        self.value_key = f"{self.platform_domain}.{entity_description.key}"
+        CoordinatorEntity.__init__(self, stove_coordinator, self.value_key)
         HWAMStoveBaseEntity.__init__(
             self,
-            stove_coordinator.stove,
             stove_coordinator.config_entry,
             entity_description,
         )
 
     async def async_added_to_hass(self) -> None:
-        """Update value when added."""
+        """Register the value extractor and update value when added."""
+        self.async_on_remove(
+            self.coordinator.async_add_value_extractor(
+                self.value_key, self._extract_value
+            )
+        )
         await super().async_added_to_hass()
         self._handle_coordinator_update()
+
+    @abstractmethod
+    def _extract_value(self, data: dict[str, Any]) -> Any:
+        """Compute the entity value from the coordinator data."""
+
+    @abstractmethod
+    @callback
+    def _apply_value(self, value: Any) -> None:
+        """Apply a value computed by _extract_value to the entity."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle status updates from the coordinator."""
+        self._apply_value(self.coordinator.values.get(self.value_key))
+        self.async_write_ha_state()
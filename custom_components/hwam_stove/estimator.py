@@ -0,0 +1,80 @@
+"""Estimation of HWAM Stove values between polls."""
+
+from __future__ import annotations
+
+# Seconds after the last sample up to which a trend is extrapolated.
+MAX_HORIZON = 600
+
+
+class LinearTrend:
+    """Incremental linear fit of a value over time.
+
+    Older samples are weighted down by the forgetting factor on every new
+    sample, so the fit follows the curve of the current burn phase. Each
+    sample costs constant time and memory.
+    """
+
+    def __init__(
+        self,
+        forgetting: float = 0.7,
+        max_horizon: float = MAX_HORIZON,
+        margin: float = 10,
+    ) -> None:
+        """Initialize the trend."""
+        self.forgetting = forgetting
+        self.max_horizon = max_horizon
+        self.margin = margin
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._origin: float | None = None
+        self._last_time = 0.0
+        self._count = 0
+        self._sw = self._st = self._sy = self._stt = self._sty = 0.0
+        self._min = self._max = 0.0
+        self.residual: float | None = None
+
+    def add(self, time: float, value: float) -> None:
+        """Add a sample and update the mean absolute prediction error."""
+        if (predicted := self.estimate(time)) is not None:
+            error = abs(value - predicted)
+            self.residual = (
+                error
+                if self.residual is None
+                else self.forgetting * self.residual + (1 - self.forgetting) * error
+            )
+        if self._origin is None:
+            self._origin = time
+            self._min = self._max = value
+        else:
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+        t = time - self._origin
+        f = self.forgetting
+        self._sw = f * self._sw + 1
+        self._st = f * self._st + t
+        self._sy = f * self._sy + value
+        self._stt = f * self._stt + t * t
+        self._sty = f * self._sty + t * value
+        self._last_time = t
+        self._count += 1
+
+    def estimate(self, time: float) -> float | None:
+        """Return the fitted value at time.
+
+        Extrapolation is limited to max_horizon seconds after the last
+        sample, and to margin beyond the range of the samples.
+        """
+        if self._origin is None:
+            return None
+        t = min(time - self._origin, self._last_time + self.max_horizon)
+        denominator = self._sw * self._stt - self._st * self._st
+        if self._count < 2 or abs(denominator) < 1e-9:
+            return self._sy / self._sw
+        slope = (self._sw * self._sty - self._st * self._sy) / denominator
+        intercept = (self._sy - slope * self._st) / self._sw
+        return min(
+            max(intercept + slope * t, self._min - self.margin),
+            self._max + self.margin,
+        )
@@ -0,0 +1,136 @@
+"""Export of HWAM Stove history from the recorder."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import csv
+from datetime import datetime, timedelta
+import gzip
+import heapq
+import logging
+from typing import IO, Any
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+EXPORT_CHUNK = timedelta(days=1)
+# The recorder leaves out states recorded exactly at either end of a
+# query, so a chunk is read this much past its end.
+CHUNK_OVERLAP = timedelta(milliseconds=1)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _open_output(path: str) -> IO[str]:
+    """Open the export file, gzip compressed if the name ends with .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt", newline="")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def read_history_chunk(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    start: datetime,
+    end: datetime,
+    include_start_time_state: bool,
+) -> list[tuple[float, str, Any]]:
+    """Return the state changes of one chunk, ordered by time."""
+    states = history.get_significant_states(
+        hass,
+        start,
+        end,
+        entity_ids,
+        include_start_time_state=include_start_time_state,
+        significant_changes_only=False,
+        minimal_response=True,
+        no_attributes=True,
+        compressed_state_format=True,
+    )
+    return list(
+        heapq.merge(
+            *(
+                [
+                    (
+                        row[COMPRESSED_STATE_LAST_UPDATED],
+                        entity_id,
+                        row[COMPRESSED_STATE_STATE],
+                    )
+                    for row in rows
+                ]
+                for entity_id, rows in states.items()
+            )
+        )
+    )
+
+
+def read_history(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    start: datetime,
+    end: datetime,
+) -> Iterator[tuple[float, str, Any]]:
+    """Yield the state changes from start to end, ordered by time.
+
+    History is read one EXPORT_CHUNK at a time. Each chunk keeps the
+    states recorded up to and including its end, which the next chunk
+    leaves out.
+    """
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + EXPORT_CHUNK, end)
+        boundary = chunk_end.timestamp()
+        for row in read_history_chunk(
+            hass,
+            entity_ids,
+            chunk_start,
+            chunk_end + CHUNK_OVERLAP if chunk_end < end else end,
+            chunk_start == start,
+        ):
+            if row[0] <= boundary:
+                yield row
+        chunk_start = chunk_end
+
+
+def export_history(
+    hass: HomeAssistant,
+    path: str,
+    entity_ids: list[str],
+    start: datetime,
+    end: datetime,
+) -> int:
+    """Write the history of entity_ids to a CSV file, return the row count.
+
+    History is read one EXPORT_CHUNK at a time, so memory use does not
+    depend on the length of the period. Must run in the recorder executor.
+    """
+    rows = 0
+    with _open_output(path) as file:
+        writer = csv.writer(file)
+        writer.writerow(["time", "entity_id", "state"])
+        for timestamp, entity_id, state in read_history(hass, entity_ids, start, end):
+            writer.writerow(
+                [
+                    dt_util.utc_from_timestamp(timestamp).isoformat(),
+                    entity_id,
+                    state,
+                ]
+            )
+            rows += 1
+    return rows
+
+
+async def async_export_history(
+    hass: HomeAssistant,
+    path: str,
+    entity_ids: list[str],
+    start: datetime,
+    end: datetime,
+) -> None:
+    """Export history in the recorder executor."""
+    rows = await get_instance(hass).async_add_executor_job(
+        export_history, hass, path, entity_ids, start, end
+    )
+    _LOGGER.info("Exported %d states to %s", rows, path)
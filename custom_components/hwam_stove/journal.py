@@ -0,0 +1,136 @@
+"""Persistent journal of the alarms of a HWAM Stove."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+from operator import itemgetter
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from pystove import pystove
+
+from .const import DOMAIN
+
+JOURNALED_ALARMS = (pystove.DATA_MAINTENANCE_ALARMS, pystove.DATA_SAFETY_ALARMS)
+JOURNAL_SIZE = 1000
+# Seconds a change waits before the journal is written, to bundle writes.
+JOURNAL_SAVE_DELAY = 60
+STORAGE_VERSION = 1
+
+_timestamp = itemgetter(0)
+
+
+def _as_dicts(entries: Iterable[list[Any]]) -> list[dict[str, Any]]:
+    """Return journal entries in readable form."""
+    return [
+        {
+            "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+            "category": category,
+            "alarm": alarm,
+            "raised": raised,
+        }
+        for timestamp, category, alarm, raised in entries
+    ]
+
+
+class AlarmJournal:
+    """Bounded journal of the alarms raised and cleared by a stove.
+
+    Entries are [timestamp, category, alarm, raised] lists in time order,
+    so queries by time bisect the journal. The oldest entries are dropped
+    beyond JOURNAL_SIZE.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the journal of a config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.alarms.{entry_id}"
+        )
+        self.entries: list[list[Any]] = []
+        self.active: set[tuple[str, str]] = set()
+
+    async def async_load(self) -> None:
+        """Load the journal from storage."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        self.entries = stored["entries"]
+        self.active = {(category, alarm) for category, alarm in stored["active"]}
+
+    async def async_remove(self) -> None:
+        """Remove the journal from storage."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the journal to save."""
+        return {"entries": self.entries, "active": sorted(self.active)}
+
+    @callback
+    def async_update(
+        self, timestamp: float, category: str, alarms: Iterable[str]
+    ) -> None:
+        """Add the alarms of category raised or cleared since the last update.
+
+        Active alarms survive restarts, so alarms cleared while Home
+        Assistant was stopped are journaled on the first update.
+        """
+        current = {(category, alarm) for alarm in alarms}
+        previous = {active for active in self.active if active[0] == category}
+        if current == previous:
+            return
+        self.entries.extend(
+            [timestamp, category, alarm, True]
+            for _, alarm in sorted(current - previous)
+        )
+        self.entries.extend(
+            [timestamp, category, alarm, False]
+            for _, alarm in sorted(previous - current)
+        )
+        self.active = (self.active - previous) | current
+        if len(self.entries) > JOURNAL_SIZE:
+            del self.entries[: len(self.entries) - JOURNAL_SIZE]
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    def query(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        category: str | None = None,
+        alarm: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the entries between start and end, oldest first."""
+        first = (
+            0
+            if start is None
+            else bisect_left(self.entries, start.timestamp(), key=_timestamp)
+        )
+        last = (
+            len(self.entries)
+            if end is None
+            else bisect_right(self.entries, end.timestamp(), key=_timestamp)
+        )
+        return _as_dicts(
+            entry
+            for entry in self.entries[first:last]
+            if (category is None or entry[1] == category)
+            and (alarm is None or entry[2] == alarm)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the journal."""
+        return {
+            "active": [
+                {"category": category, "alarm": alarm}
+                for category, alarm in sorted(self.active)
+            ],
+            "entries": len(self.entries),
+            "oldest": dt_util.utc_from_timestamp(self.entries[0][0]).isoformat()
+            if self.entries
+            else None,
+            "recent": _as_dicts(self.entries[-20:]),
+        }
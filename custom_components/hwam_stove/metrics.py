@@ -0,0 +1,75 @@
+"""Rolling measurements for the HWAM Stove integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+import math
+import sys
+from typing import Any
+
+# Objects defined in these packages are followed into their attributes.
+OWNED_PACKAGES = (__package__, "pystove")
+
+
+class RollingSamples:
+    """Keep a bounded number of recent samples and report percentiles."""
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the samples."""
+        self._samples: deque[float] = deque(maxlen=maxlen)
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest one when full."""
+        self._samples.append(value)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile of the samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return a summary of the samples."""
+        return {
+            "count": len(self._samples),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self._samples, default=None),
+        }
+
+
+def deep_sizeof(obj: Any, exclude: Iterable[Any] = ()) -> int:
+    """Return the approximate size in bytes of obj and the objects it holds.
+
+    Containers are followed, as are the attributes of objects from
+    OWNED_PACKAGES. Other objects, such as the Home Assistant core and the
+    HTTP session, only count their own size. Excluded objects and objects
+    reached twice are not counted.
+    """
+    seen = {id(item) for item in exclude}
+    stack = [obj]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset | deque):
+            stack.extend(item)
+        elif type(item).__module__.startswith(OWNED_PACKAGES) and hasattr(
+            item, "__dict__"
+        ):
+            stack.append(vars(item))
+    return size
@@ -12,6 +12,7 @@ from typing import Any, Callable
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -62,25 +63,34 @@ async def async_setup_entry(
             entity_description,
         )
         for entity_description in NUMBER_DESCRIPTIONS
+        if stove_hub.is_monitored(entity_description.key)
     )
 
 
 class HwamStoveNumber(HWAMStoveCoordinatorEntity, NumberEntity):
     """Representation of a HWAM Stove number entity."""
 
+    platform_domain = Platform.NUMBER
+
     entity_description: HWAMStoveNumberEntityDescription
 
+    def _extract_value(self, data: dict[str, Any]) -> float:
+        """Compute the number value from the coordinator data."""
+        return self.entity_description.state_func(data[self.entity_description.key])
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle status updates from the component."""
-        self._attr_native_value = self.entity_description.state_func(
-            self.coordinator.data[self.entity_description.key]
-        )
-        self.async_write_ha_state()
+    def _apply_value(self, value: float) -> None:
+        """Apply a new number value."""
+        self._attr_native_value = value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value on the stove."""
-        success = await self.entity_description.set_func(self.stove, value)
+        success = await self.coordinator.async_write_setting(
+            self.value_key,
+            value,
+            lambda: self.entity_description.set_func(self.coordinator.stove, value),
+        )
         if success:
             self._attr_native_value = value
+            self.coordinator.async_invalidate_value(self.value_key)
             self.async_write_ha_state()
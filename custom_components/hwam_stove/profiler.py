@@ -0,0 +1,100 @@
+"""On-demand profiling of the HWAM Stove integration."""
+
+from __future__ import annotations
+
+import cProfile
+from datetime import datetime
+import io
+import logging
+import pstats
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_PROFILER, DOMAIN
+from .coordinator import StoveCoordinator
+
+# Functions shown in the summary, matched against their file names.
+SUMMARY_FILTER = "hwam_stove|pystove"
+SUMMARY_LENGTH = 25
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _write_profile(profiler: cProfile.Profile, path: str) -> str:
+    """Write the profile and a summary of its top functions."""
+    profiler.dump_stats(path)
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(
+        pstats.SortKey.CUMULATIVE
+    ).print_stats(SUMMARY_FILTER, SUMMARY_LENGTH)
+    summary = stream.getvalue()
+    with open(f"{path}.txt", "w", encoding="utf-8") as file:
+        file.write(summary)
+    return summary
+
+
+@callback
+def async_start_profile(
+    hass: HomeAssistant,
+    coordinator: StoveCoordinator,
+    path: str,
+    cycles: int,
+    duration: float,
+) -> None:
+    """Profile the event loop for the next update cycles of the coordinator.
+
+    The profile stops after cycles polls of the stove, or after duration
+    seconds if the polls take longer. The profiler covers polls, listener
+    updates and commands alike, and is only installed while the profile
+    runs. The profile is written to path in pstats format, with a summary
+    next to it.
+    """
+    if DATA_PROFILER in hass.data[DOMAIN]:
+        raise HomeAssistantError("A profile is already running")
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as err:
+        raise HomeAssistantError(f"Unable to start the profiler: {err}") from err
+    remaining = cycles
+
+    @callback
+    def stop() -> None:
+        """Stop profiling and write the results."""
+        if hass.data[DOMAIN].get(DATA_PROFILER) is not stop:
+            return
+        profiler.disable()
+        del hass.data[DOMAIN][DATA_PROFILER]
+        remove_listener()
+        cancel_timeout()
+        hass.async_create_background_task(
+            _async_save(hass, profiler, path), f"hwam_stove profile {path}"
+        )
+
+    @callback
+    def cycle_done() -> None:
+        """Stop profiling after the requested number of cycles."""
+        nonlocal remaining
+        remaining -= 1
+        if remaining <= 0:
+            stop()
+
+    @callback
+    def timeout(_now: datetime) -> None:
+        """Stop profiling when the cycles take too long."""
+        stop()
+
+    hass.data[DOMAIN][DATA_PROFILER] = stop
+    remove_listener = coordinator.async_add_cycle_listener(cycle_done)
+    cancel_timeout = async_call_later(hass, duration, timeout)
+    coordinator.config_entry.async_on_unload(stop)
+
+
+async def _async_save(
+    hass: HomeAssistant, profiler: cProfile.Profile, path: str
+) -> None:
+    """Write a profile in the executor and log its summary."""
+    summary = await hass.async_add_executor_job(_write_profile, profiler, path)
+    _LOGGER.info("Wrote profile to %s:\n%s", path, summary)
@@ -0,0 +1,56 @@
+"""Read-through proxy of the raw HWAM Stove data."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from http import HTTPStatus
+import math
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.util import dt as dt_util
+
+from pystove import pystove
+
+from .const import DATA_STOVES, DOMAIN
+from .trace import RecordingStove
+
+
+class StoveDataView(HomeAssistantView):
+    """Serve the last raw stove data polled by the coordinator.
+
+    The response has the format of the stove's own get_stove_data
+    endpoint, so other clients share the coordinator's polls instead of
+    polling the stove themselves.
+    """
+
+    url = f"/api/{DOMAIN}/{{entry_id}}{pystove.STOVE_DATA_URL}"
+    name = f"api:{DOMAIN}:stove_data"
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        """Return the last raw stove data with freshness headers."""
+        hass = request.app[KEY_HASS]
+        stove_hub = hass.data.get(DOMAIN, {}).get(DATA_STOVES, {}).get(entry_id)
+        if stove_hub is None or not stove_hub.raw_data_proxy:
+            return self.json_message("Stove not found", HTTPStatus.NOT_FOUND)
+        stove = stove_hub.stove
+        if not isinstance(stove, RecordingStove) or stove.raw_data is None:
+            return self.json_message(
+                "No stove data yet", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+
+        updated = stove.raw_data_updated.replace(microsecond=0)
+        if (
+            since := request.if_modified_since
+        ) is not None and updated <= dt_util.as_utc(since):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED)
+
+        age = max(0, (dt_util.utcnow() - stove.raw_data_updated).total_seconds())
+        interval = stove_hub.update_interval or timedelta(0)
+        response = self.json(stove.raw_data)
+        response.last_modified = updated
+        response.headers[hdrs.AGE] = str(math.floor(age))
+        response.headers[hdrs.CACHE_CONTROL] = (
+            f"max-age={max(0, math.floor(interval.total_seconds() - age))}"
+        )
+        return response
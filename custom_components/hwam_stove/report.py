@@ -0,0 +1,195 @@
+"""Seasonal burn report of a HWAM Stove from the recorder history."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+import json
+import logging
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from pystove import pystove
+
+from .const import DATA_EARLY_WARNINGS
+from .export import read_history
+
+# Phase sensor states during which the stove is burning.
+BURNING_PHASES = {"ignition", "burn", "glow"}
+
+REPORTED_KEYS = {
+    pystove.DATA_BURN_LEVEL,
+    pystove.DATA_OXYGEN_LEVEL,
+    pystove.DATA_PHASE,
+    pystove.DATA_REFILL_ALARM,
+    pystove.DATA_STOVE_TEMPERATURE,
+}
+ALARM_KEY_PREFIXES = (
+    pystove.DATA_MAINTENANCE_ALARMS,
+    pystove.DATA_SAFETY_ALARMS,
+    DATA_EARLY_WARNINGS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _as_float(state: str | None) -> float | None:
+    """Return a numeric state, or None if it has no number."""
+    try:
+        return float(state)
+    except (TypeError, ValueError):
+        return None
+
+
+class SeasonReport:
+    """Accumulate burn figures from state changes ordered by time.
+
+    Every state change costs constant time; the figures are time weighted
+    over the intervals between changes.
+    """
+
+    def __init__(self, keys: dict[str, str]) -> None:
+        """Initialize the report for entity IDs mapped to their data keys."""
+        self.keys = keys
+        self.states: dict[str, str] = {}
+        self.last_time: float | None = None
+        self.burn_seconds_per_day: dict[str, float] = defaultdict(float)
+        self.phase_seconds: dict[str, float] = defaultdict(float)
+        self.ignitions = 0
+        self.refills = 0
+        self.alarms: dict[str, int] = defaultdict(int)
+        # Seconds, and time weighted sums of oxygen level and temperature.
+        self.burn_levels: dict[int, list[float]] = defaultdict(lambda: [0.0] * 5)
+
+    def add(self, timestamp: float, entity_id: str, state: str) -> None:
+        """Add a state change."""
+        if self.last_time is not None:
+            self._accumulate(self.last_time, timestamp)
+        self.last_time = timestamp
+
+        key = self.keys[entity_id]
+        had_state = key in self.states
+        old_state = self.states.get(key)
+        self.states[key] = state
+        if not had_state or old_state == state:
+            return
+        if key == pystove.DATA_PHASE and state == "ignition":
+            self.ignitions += 1
+        elif state == STATE_ON and old_state != STATE_ON:
+            if key == pystove.DATA_REFILL_ALARM:
+                self.refills += 1
+            elif key.startswith(ALARM_KEY_PREFIXES):
+                self.alarms[key] += 1
+
+    def finish(self, timestamp: float) -> None:
+        """Account for the time from the last state change to timestamp."""
+        if self.last_time is not None:
+            self._accumulate(self.last_time, timestamp)
+            self.last_time = timestamp
+
+    def _accumulate(self, start: float, end: float) -> None:
+        """Add an interval with the current states to the figures."""
+        if (phase := self.states.get(pystove.DATA_PHASE)) is None or end <= start:
+            return
+        duration = end - start
+        self.phase_seconds[phase] += duration
+        if phase not in BURNING_PHASES:
+            return
+
+        day_start = start
+        while day_start < end:
+            local = dt_util.as_local(dt_util.utc_from_timestamp(day_start))
+            next_day = dt_util.start_of_local_day(local + timedelta(days=1))
+            day_end = min(end, next_day.timestamp())
+            self.burn_seconds_per_day[local.date().isoformat()] += day_end - day_start
+            day_start = day_end
+
+        if (level := _as_float(self.states.get(pystove.DATA_BURN_LEVEL))) is None:
+            return
+        sums = self.burn_levels[int(level)]
+        sums[0] += duration
+        oxygen = _as_float(self.states.get(pystove.DATA_OXYGEN_LEVEL))
+        if oxygen is not None:
+            sums[1] += duration
+            sums[2] += oxygen * duration
+        temperature = _as_float(self.states.get(pystove.DATA_STOVE_TEMPERATURE))
+        if temperature is not None:
+            sums[3] += duration
+            sums[4] += temperature * duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report."""
+        return {
+            "burn_hours": round(sum(self.burn_seconds_per_day.values()) / 3600, 2),
+            "daily_burn_hours": {
+                day: round(seconds / 3600, 2)
+                for day, seconds in sorted(self.burn_seconds_per_day.items())
+            },
+            "ignitions": self.ignitions,
+            "phase_hours": {
+                phase: round(seconds / 3600, 2)
+                for phase, seconds in sorted(self.phase_seconds.items())
+            },
+            "burn_levels": {
+                level: {
+                    "hours": round(seconds / 3600, 2),
+                    "mean_oxygen_level": round(oxygen / oxygen_seconds, 1)
+                    if oxygen_seconds
+                    else None,
+                    "mean_stove_temperature": round(temperature / temperature_seconds)
+                    if temperature_seconds
+                    else None,
+                }
+                for level, (
+                    seconds,
+                    oxygen_seconds,
+                    oxygen,
+                    temperature_seconds,
+                    temperature,
+                ) in sorted(self.burn_levels.items())
+            },
+            "refills": self.refills,
+            "alarms": dict(sorted(self.alarms.items())),
+        }
+
+
+def generate_report(
+    hass: HomeAssistant,
+    path: str,
+    keys: dict[str, str],
+    start: datetime,
+    end: datetime,
+) -> dict[str, Any]:
+    """Write a burn report of the entities in keys to a JSON file.
+
+    History is read one EXPORT_CHUNK at a time, so memory use does not
+    depend on the length of the season. Must run in the recorder executor.
+    """
+    report = SeasonReport(keys)
+    for timestamp, entity_id, state in read_history(hass, list(keys), start, end):
+        report.add(max(timestamp, start.timestamp()), entity_id, state)
+    report.finish(end.timestamp())
+
+    result = {"start": start.isoformat(), "end": end.isoformat(), **report.as_dict()}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(result, file, separators=(",", ":"))
+    return result
+
+
+async def async_generate_report(
+    hass: HomeAssistant,
+    path: str,
+    keys: dict[str, str],
+    start: datetime,
+    end: datetime,
+) -> dict[str, Any]:
+    """Generate a burn report in the recorder executor."""
+    result = await get_instance(hass).async_add_executor_job(
+        generate_report, hass, path, keys, start, end
+    )
+    _LOGGER.info("Wrote burn report to %s", path)
+    return result
@@ -9,17 +9,23 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 import logging
-from typing import Callable
+from typing import Any, Callable
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     EntityCategory,
+    Platform,
+    UnitOfEnergy,
+    UnitOfMass,
+    UnitOfPower,
     UnitOfTemperature,
     UnitOfTime,
 )
@@ -29,7 +35,26 @@ from homeassistant.util import dt
 
 from pystove import pystove
 
-from .const import DATA_STOVES, DOMAIN, StoveDeviceIdentifier
+from .const import (
+    DATA_CLOCK_DRIFT,
+    DATA_CONNECT_TIME,
+    DATA_DNS_TIME,
+    DATA_FIRST_BYTE_TIME,
+    DATA_HEAT_ENERGY,
+    DATA_HEAT_OUTPUT,
+    DATA_PARSE_TIME,
+    DATA_ROOM_TEMPERATURE_ESTIMATE,
+    DATA_ROOM_TEMPERATURE_RESIDUAL,
+    DATA_SEASON_BURN_HOURS,
+    DATA_SEASON_IGNITIONS,
+    DATA_STOVE_TEMPERATURE_ESTIMATE,
+    DATA_STOVE_TEMPERATURE_RESIDUAL,
+    DATA_STOVES,
+    DATA_TRANSFER_TIME,
+    DATA_WOOD_CONSUMPTION,
+    DOMAIN,
+    StoveDeviceIdentifier,
+)
 from .entity import HWAMStoveCoordinatorEntity, HWAMStoveEntityDescription
 
 
@@ -100,6 +125,14 @@ SENSOR_DESCRIPTIONS = [
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:function-variant",
     ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_CLOCK_DRIFT,
+        translation_key="clock_drift",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
     HWAMStoveSensorEntityDescription(
         key=pystove.DATA_MESSAGE_ID,
         translation_key="message_id",
@@ -220,6 +253,146 @@ SENSOR_DESCRIPTIONS = [
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:valve",
     ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_SEASON_BURN_HOURS,
+        translation_key="season_burn_hours",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=1,
+        icon="mdi:fireplace",
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_SEASON_IGNITIONS,
+        translation_key="season_ignitions",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        icon="mdi:fire-alert",
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_DNS_TIME,
+        translation_key="dns_time",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:dns",
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_CONNECT_TIME,
+        translation_key="connect_time",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:lan-connect",
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_FIRST_BYTE_TIME,
+        translation_key="first_byte_time",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:timer-sand",
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_TRANSFER_TIME,
+        translation_key="transfer_time",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:download-network",
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_PARSE_TIME,
+        translation_key="parse_time",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:code-json",
+    ),
+]
+
+# Only created when interpolation is enabled.
+ESTIMATE_SENSOR_DESCRIPTIONS = [
+    HWAMStoveSensorEntityDescription(
+        key=DATA_ROOM_TEMPERATURE_ESTIMATE,
+        translation_key="room_temperature_estimate",
+        device_identifier=StoveDeviceIdentifier.REMOTE,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_ROOM_TEMPERATURE_RESIDUAL,
+        translation_key="room_temperature_residual",
+        device_identifier=StoveDeviceIdentifier.REMOTE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:chart-bell-curve",
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_STOVE_TEMPERATURE_ESTIMATE,
+        translation_key="stove_temperature_estimate",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_STOVE_TEMPERATURE_RESIDUAL,
+        translation_key="stove_temperature_residual",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:chart-bell-curve",
+    ),
+]
+
+# Only created when a stove rating is configured.
+ENERGY_SENSOR_DESCRIPTIONS = [
+    HWAMStoveSensorEntityDescription(
+        key=DATA_HEAT_OUTPUT,
+        translation_key="heat_output",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        suggested_display_precision=1,
+    ),
+]
+
+# Totals that are restored after a restart.
+TOTAL_SENSOR_DESCRIPTIONS = [
+    HWAMStoveSensorEntityDescription(
+        key=DATA_HEAT_ENERGY,
+        translation_key="heat_energy",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=1,
+    ),
+    HWAMStoveSensorEntityDescription(
+        key=DATA_WOOD_CONSUMPTION,
+        translation_key="wood_consumption",
+        device_identifier=StoveDeviceIdentifier.STOVE,
+        device_class=SensorDeviceClass.WEIGHT,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfMass.KILOGRAMS,
+        suggested_display_precision=1,
+        icon="mdi:pine-tree",
+    ),
 ]
 
 _LOGGER = logging.getLogger(__name__)
@@ -237,19 +410,51 @@ async def async_setup_entry(
             stove_device,
             description,
         )
-        for description in SENSOR_DESCRIPTIONS
+        for description in (
+            *SENSOR_DESCRIPTIONS,
+            *(ESTIMATE_SENSOR_DESCRIPTIONS if stove_device.trends else []),
+        )
+        if stove_device.is_monitored(description.key)
     )
+    if stove_device.energy_meter is not None:
+        async_add_entities(
+            HwamStoveSensor(stove_device, description)
+            for description in ENERGY_SENSOR_DESCRIPTIONS
+            if stove_device.is_monitored(description.key)
+        )
+        async_add_entities(
+            HwamStoveTotalSensor(stove_device, description)
+            for description in TOTAL_SENSOR_DESCRIPTIONS
+            if stove_device.is_monitored(description.key)
+        )
 
 
 class HwamStoveSensor(HWAMStoveCoordinatorEntity, SensorEntity):
     """Representation of a HWAM Stove sensor."""
 
+    platform_domain = Platform.SENSOR
+
     entity_description: HWAMStoveSensorEntityDescription
 
+    def _extract_value(self, data: dict[str, Any]) -> Any:
+        """Compute the sensor value from the coordinator data."""
+        return self.entity_description.state_func(data, self.entity_description.key)
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle status updates from the component."""
-        self._attr_native_value = self.entity_description.state_func(
-            self.coordinator.data, self.entity_description.key
-        )
-        self.async_write_ha_state()
+    def _apply_value(self, value: Any) -> None:
+        """Apply a new sensor value."""
+        self._attr_native_value = value
+
+
+class HwamStoveTotalSensor(HwamStoveSensor, RestoreSensor):
+    """Representation of a HWAM Stove total that survives restarts."""
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the total from before the restart."""
+        if (
+            last_data := await self.async_get_last_sensor_data()
+        ) is not None and last_data.native_value is not None:
+            self.coordinator.async_restore_total(
+                self.entity_description.key, float(last_data.native_value)
+            )
+        await super().async_added_to_hass()
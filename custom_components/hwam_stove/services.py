@@ -0,0 +1,282 @@
+"""Services for the HWAM Stove integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import os
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.util import dt as dt_util
+import voluptuous as vol
+
+from pystove import pystove
+
+from .const import (
+    ATTR_ALARM,
+    ATTR_CATEGORY,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    ATTR_DURATION,
+    ATTR_END,
+    ATTR_FILENAME,
+    ATTR_SPEED,
+    ATTR_START,
+    DATA_STOVES,
+    DOMAIN,
+    SERVICE_APPLY_SETTINGS,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_GENERATE_REPORT,
+    SERVICE_PROFILE,
+    SERVICE_QUERY_ALARMS,
+    SERVICE_REPLAY_TRACE,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+)
+from .coordinator import StoveCoordinator
+from .export import async_export_history
+from .journal import JOURNALED_ALARMS
+from .profiler import async_start_profile
+from .report import ALARM_KEY_PREFIXES, REPORTED_KEYS, async_generate_report
+
+FILENAME = vol.All(cv.string, vol.Match(r"^[\w.-]+$"))
+
+SERVICE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+START_CAPTURE_SCHEMA = SERVICE_SCHEMA.extend({vol.Optional(ATTR_FILENAME): FILENAME})
+
+APPLY_SETTINGS_SCHEMA = vol.All(
+    SERVICE_SCHEMA.extend(
+        {
+            vol.Optional(pystove.DATA_BURN_LEVEL): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=5)
+            ),
+            vol.Optional(pystove.DATA_NIGHT_LOWERING): cv.boolean,
+            vol.Optional(pystove.DATA_NIGHT_BEGIN_TIME): cv.time,
+            vol.Optional(pystove.DATA_NIGHT_END_TIME): cv.time,
+            vol.Optional(pystove.DATA_REMOTE_REFILL_ALARM): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(
+        pystove.DATA_BURN_LEVEL,
+        pystove.DATA_NIGHT_LOWERING,
+        pystove.DATA_NIGHT_BEGIN_TIME,
+        pystove.DATA_NIGHT_END_TIME,
+        pystove.DATA_REMOTE_REFILL_ALARM,
+    ),
+)
+
+EXPORT_HISTORY_SCHEMA = SERVICE_SCHEMA.extend(
+    {
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Required(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_FILENAME): FILENAME,
+    }
+)
+
+PROFILE_SCHEMA = SERVICE_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_CYCLES, default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional(ATTR_DURATION, default=600): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(ATTR_FILENAME): FILENAME,
+    }
+)
+
+QUERY_ALARMS_SCHEMA = SERVICE_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_CATEGORY): vol.In(JOURNALED_ALARMS),
+        vol.Optional(ATTR_ALARM): cv.string,
+    }
+)
+
+REPLAY_TRACE_SCHEMA = SERVICE_SCHEMA.extend(
+    {
+        vol.Required(ATTR_FILENAME): FILENAME,
+        vol.Optional(ATTR_SPEED, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> StoveCoordinator:
+    """Return the coordinator for the config entry in a service call."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    try:
+        return hass.data[DOMAIN][DATA_STOVES][entry_id]
+    except KeyError as err:
+        raise ServiceValidationError(
+            f"No loaded HWAM Stove config entry {entry_id}"
+        ) from err
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return value in UTC, treating naive values as local time."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.get_default_time_zone())
+    return dt_util.as_utc(value)
+
+
+async def _async_get_path(hass: HomeAssistant, filename: str) -> str:
+    """Return the path of a file in the integration's directory."""
+    directory = hass.config.path(DOMAIN)
+    await hass.async_add_executor_job(os.makedirs, directory, 0o755, True)
+    return os.path.join(directory, filename)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the HWAM Stove services."""
+
+    async def apply_settings(call: ServiceCall) -> None:
+        """Apply several stove settings at once."""
+        coordinator = _get_coordinator(hass, call)
+        settings = dict(call.data)
+        settings.pop(ATTR_CONFIG_ENTRY_ID)
+        await coordinator.async_apply_settings(settings)
+
+    async def export_history(call: ServiceCall) -> None:
+        """Export the history of a stove's entities to a CSV file."""
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        _get_coordinator(hass, call)
+        start = _as_utc(call.data[ATTR_START])
+        end = _as_utc(call.data[ATTR_END])
+        if start >= end:
+            raise ServiceValidationError("Start must be before end")
+        entity_ids = [
+            entity_entry.entity_id
+            for entity_entry in er.async_entries_for_config_entry(
+                er.async_get(hass), entry_id
+            )
+        ]
+        filename = call.data.get(
+            ATTR_FILENAME, f"{entry_id}-{start:%Y%m%d}-{end:%Y%m%d}.csv.gz"
+        )
+        path = await _async_get_path(hass, filename)
+        hass.async_create_background_task(
+            async_export_history(hass, path, entity_ids, start, end),
+            f"hwam_stove export {path}",
+        )
+
+    async def generate_report(call: ServiceCall) -> None:
+        """Write a burn report of a stove's history to a JSON file."""
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        coordinator = _get_coordinator(hass, call)
+        start = _as_utc(call.data[ATTR_START])
+        end = _as_utc(call.data[ATTR_END])
+        if start >= end:
+            raise ServiceValidationError("Start must be before end")
+        keys = {}
+        for entity_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), entry_id
+        ):
+            key = entity_entry.unique_id.removeprefix(f"{entry_id}-")
+            if key in REPORTED_KEYS or key.startswith(ALARM_KEY_PREFIXES):
+                keys[entity_entry.entity_id] = key
+        filename = call.data.get(
+            ATTR_FILENAME, f"{entry_id}-report-{start:%Y%m%d}-{end:%Y%m%d}.json"
+        )
+        path = await _async_get_path(hass, filename)
+
+        async def async_report() -> None:
+            """Generate the report and publish its summary."""
+            coordinator.async_set_report(
+                await async_generate_report(hass, path, keys, start, end)
+            )
+
+        hass.async_create_background_task(async_report(), f"hwam_stove report {path}")
+
+    async def profile(call: ServiceCall) -> None:
+        """Profile the next coordinator cycles of a stove."""
+        coordinator = _get_coordinator(hass, call)
+        filename = call.data.get(
+            ATTR_FILENAME,
+            f"{call.data[ATTR_CONFIG_ENTRY_ID]}-{dt_util.utcnow():%Y%m%d%H%M%S}.prof",
+        )
+        async_start_profile(
+            hass,
+            coordinator,
+            await _async_get_path(hass, filename),
+            call.data[ATTR_CYCLES],
+            call.data[ATTR_DURATION],
+        )
+
+    async def query_alarms(call: ServiceCall) -> ServiceResponse:
+        """Return the journaled alarms of a stove."""
+        coordinator = _get_coordinator(hass, call)
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+        return {
+            "alarms": coordinator.alarm_journal.query(
+                None if start is None else _as_utc(start),
+                None if end is None else _as_utc(end),
+                call.data.get(ATTR_CATEGORY),
+                call.data.get(ATTR_ALARM),
+            )
+        }
+
+    async def start_capture(call: ServiceCall) -> None:
+        """Start capturing raw stove responses to a trace file."""
+        coordinator = _get_coordinator(hass, call)
+        filename = call.data.get(
+            ATTR_FILENAME,
+            f"{call.data[ATTR_CONFIG_ENTRY_ID]}-"
+            f"{dt_util.utcnow():%Y%m%d%H%M%S}.jsonl.gz",
+        )
+        await coordinator.async_start_capture(await _async_get_path(hass, filename))
+
+    async def stop_capture(call: ServiceCall) -> None:
+        """Stop capturing raw stove responses."""
+        await _get_coordinator(hass, call).async_stop_capture()
+
+    async def replay_trace(call: ServiceCall) -> None:
+        """Replay a trace file through a stove's coordinator."""
+        coordinator = _get_coordinator(hass, call)
+        path = await _async_get_path(hass, call.data[ATTR_FILENAME])
+        if not await hass.async_add_executor_job(os.path.isfile, path):
+            raise ServiceValidationError(f"Trace file {path} does not exist")
+        if coordinator.replay_task is not None:
+            raise ServiceValidationError(
+                f"Stove {coordinator.name} is already replaying a trace"
+            )
+        coordinator.async_start_replay(path, call.data[ATTR_SPEED])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY_SETTINGS, apply_settings, APPLY_SETTINGS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXPORT_HISTORY, export_history, EXPORT_HISTORY_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_GENERATE_REPORT, generate_report, EXPORT_HISTORY_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, profile, PROFILE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_ALARMS,
+        query_alarms,
+        QUERY_ALARMS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_CAPTURE, start_capture, START_CAPTURE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_CAPTURE, stop_capture, SERVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_REPLAY_TRACE, replay_trace, REPLAY_TRACE_SCHEMA
+    )
@@ -12,7 +12,7 @@ from typing import Any, Callable
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -71,33 +71,47 @@ async def async_setup_entry(
             entity_description,
         )
         for entity_description in SWITCH_DESCRIPTIONS
+        if stove_hub.is_monitored(entity_description.key)
     )
 
 
 class HwamStoveBinarySensor(HWAMStoveCoordinatorEntity, SwitchEntity):
     """Representation of a HWAM Stove switch."""
 
+    platform_domain = Platform.SWITCH
+
     entity_category = EntityCategory.CONFIG
     entity_description: HWAMStoveSwitchEntityDescription
 
+    def _extract_value(self, data: dict[str, Any]) -> bool:
+        """Compute the switch state from the coordinator data."""
+        return self.entity_description.state_func(data[self.entity_description.key])
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle status updates from the component."""
-        self._attr_is_on = self.entity_description.state_func(
-            self.coordinator.data[self.entity_description.key]
-        )
-        self.async_write_ha_state()
+    def _apply_value(self, value: bool) -> None:
+        """Apply a new switch state."""
+        self._attr_is_on = value
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the switch."""
-        success = await self.entity_description.turn_off_func(self.coordinator)
+        success = await self.coordinator.async_write_setting(
+            self.value_key,
+            False,
+            lambda: self.entity_description.turn_off_func(self.coordinator),
+        )
         if success:
             self._attr_is_on = False
+            self.coordinator.async_invalidate_value(self.value_key)
             self.async_schedule_update_ha_state()
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the switch."""
-        success = await self.entity_description.turn_on_func(self.coordinator)
+        success = await self.coordinator.async_write_setting(
+            self.value_key,
+            True,
+            lambda: self.entity_description.turn_on_func(self.coordinator),
+        )
         if success:
             self._attr_is_on = True
+            self.coordinator.async_invalidate_value(self.value_key)
             self.async_schedule_update_ha_state()
@@ -13,7 +13,7 @@ from typing import Any, Callable
 
 from homeassistant.components.time import TimeEntity, TimeEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -31,7 +31,7 @@ class HWAMStoveTimeEntityDescription(
 ):
     """Describes a hwam_stove time entity."""
 
-    set_func: Callable[[StoveCoordinator, time], Awaitable[Any]]
+    set_func: Callable[[StoveCoordinator, time], Awaitable[bool]]
 
 
 TIME_DESCRIPTIONS = [
@@ -71,22 +71,33 @@ async def async_setup_entry(
             description,
         )
         for description in TIME_DESCRIPTIONS
+        if stove_device.is_monitored(description.key)
     )
 
 
 class HwamStoveTime(HWAMStoveCoordinatorEntity, TimeEntity):
     """Representation of a HWAM Stove time entity."""
 
+    platform_domain = Platform.TIME
+
     entity_category = EntityCategory.CONFIG
     entity_description: HWAMStoveTimeEntityDescription
     _attr_native_value: time | None = None
 
+    def _extract_value(self, data: dict[str, Any]) -> time:
+        """Compute the time value from the coordinator data."""
+        return data[self.entity_description.key]
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle status updates from the component."""
-        self._attr_native_value = self.coordinator.data[self.entity_description.key]
-        self.async_write_ha_state()
+    def _apply_value(self, value: time | None) -> None:
+        """Apply a new time value."""
+        self._attr_native_value = value
 
     async def async_set_value(self, value: time) -> None:
         """Update the time value on the stove."""
-        await self.entity_description.set_func(self.coordinator, value)
+        await self.coordinator.async_write_setting(
+            self.value_key,
+            value,
+            lambda: self.entity_description.set_func(self.coordinator, value),
+            {self.entity_description.key: value},
+        )
@@ -0,0 +1,108 @@
+"""Phase timing of the HTTP requests of a HWAM Stove."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    DATA_CONNECT_TIME,
+    DATA_DNS_TIME,
+    DATA_FIRST_BYTE_TIME,
+    DATA_PARSE_TIME,
+    DATA_TRANSFER_TIME,
+)
+from .metrics import RollingSamples
+
+REQUEST_PHASES = (
+    DATA_DNS_TIME,
+    DATA_CONNECT_TIME,
+    DATA_FIRST_BYTE_TIME,
+    DATA_TRANSFER_TIME,
+    DATA_PARSE_TIME,
+)
+REQUEST_SAMPLES = 100
+# Percentile of the phase durations published as values, in milliseconds.
+PUBLISHED_PERCENTILE = 95
+
+
+class RequestTimer:
+    """Time the phases of stove data requests.
+
+    DNS lookup, connecting and the time to the first byte are taken from
+    aiohttp tracing of the stove session. The stove marks when the body
+    is received and when it is parsed. Stove requests are serialized, so
+    one request is timed at a time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timer and its trace config."""
+        self.phases = {
+            phase: RollingSamples(REQUEST_SAMPLES) for phase in REQUEST_PHASES
+        }
+        self._marks: dict[str, float] = {}
+        self.trace_config = aiohttp.TraceConfig()
+        for signal, mark in (
+            (self.trace_config.on_request_start, "request_start"),
+            (self.trace_config.on_dns_resolvehost_start, "dns_start"),
+            (self.trace_config.on_dns_resolvehost_end, "dns_end"),
+            (self.trace_config.on_connection_create_start, "connect_start"),
+            (self.trace_config.on_connection_create_end, "connect_end"),
+            (self.trace_config.on_request_headers_sent, "headers_sent"),
+            (self.trace_config.on_request_end, "response_start"),
+        ):
+            signal.append(self._marker(mark))
+
+    def _marker(self, mark: str) -> Callable[..., Awaitable[None]]:
+        """Return a trace callback recording the time of mark."""
+
+        async def record(*_args: Any) -> None:
+            """Record the time of mark."""
+            self._marks[mark] = monotonic()
+
+        return record
+
+    def start(self) -> None:
+        """Start timing a data request."""
+        self._marks = {}
+
+    def mark(self, mark: str) -> None:
+        """Record the time of a mark outside of aiohttp tracing."""
+        self._marks[mark] = monotonic()
+
+    def finish(self) -> None:
+        """Add the phases of the data request once it is parsed."""
+        marks = self._marks
+        if not {"request_start", "response_start", "body_received"} <= marks.keys():
+            return
+        dns = marks["dns_end"] - marks["dns_start"] if "dns_end" in marks else 0.0
+        connect = (
+            marks["connect_end"] - marks["connect_start"] - dns
+            if "connect_end" in marks
+            else 0.0
+        )
+        sent = marks.get("headers_sent", marks["request_start"] + dns + connect)
+        for phase, duration in (
+            (DATA_DNS_TIME, dns),
+            (DATA_CONNECT_TIME, connect),
+            (DATA_FIRST_BYTE_TIME, marks["response_start"] - sent),
+            (DATA_TRANSFER_TIME, marks["body_received"] - marks["response_start"]),
+            (DATA_PARSE_TIME, monotonic() - marks["body_received"]),
+        ):
+            self.phases[phase].add(max(0.0, duration))
+
+    def percentiles(self) -> dict[str, float | None]:
+        """Return the published percentile of every phase in milliseconds."""
+        return {
+            phase: None
+            if (value := samples.percentile(PUBLISHED_PERCENTILE)) is None
+            else round(value * 1000, 1)
+            for phase, samples in self.phases.items()
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the phases in seconds."""
+        return {phase: samples.as_dict() for phase, samples in self.phases.items()}
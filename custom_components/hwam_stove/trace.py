@@ -0,0 +1,212 @@
+"""Capture and replay of raw HWAM Stove responses.
+
+A trace is a gzip compressed file with one JSON array per line, holding
+the number of seconds since the start of the capture and the raw response
+of the stove's get_stove_data endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime
+import gzip
+from itertools import islice
+import json
+import logging
+from time import monotonic
+from typing import IO, TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from pystove import pystove
+
+from .timing import RequestTimer
+
+if TYPE_CHECKING:
+    from .coordinator import StoveCoordinator
+
+REPLAY_BATCH_SIZE = 500
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RecordingStove(pystove.Stove):
+    """A pystove Stove that keeps the last raw response.
+
+    Raw responses are also passed to an optional recorder, and the phases
+    of data requests are timed.
+    """
+
+    raw_data: dict[str, Any] | None = None
+    raw_data_updated: datetime | None = None
+    recorder: TraceWriter | None = None
+    timer: RequestTimer | None = None
+
+    @classmethod
+    async def create(cls, stove_host, loop=None, skip_ident=False):
+        """Async create the Stove object with a traced session."""
+        self = await super().create(stove_host, loop, skip_ident=True)
+        await self._session.close()
+        self.timer = RequestTimer()
+        self._session = aiohttp.ClientSession(
+            headers=pystove.HTTP_HEADERS, trace_configs=[self.timer.trace_config]
+        )
+        if not skip_ident:
+            await self._identify()
+        return self
+
+    async def get_data(self):
+        """Request and process an update from the stove, timing its phases."""
+        if self.timer is None:
+            return await super().get_data()
+        self.timer.start()
+        data = await super().get_data()
+        if data is not None:
+            self.timer.finish()
+        return data
+
+    async def _get(self, url):
+        """Get data from url, marking when the response body is received."""
+        response = await super()._get(url)
+        if self.timer is not None:
+            self.timer.mark("body_received")
+        return response
+
+    async def get_raw_data(self):
+        """Request an update from the stove, record and return raw result."""
+        data = await super().get_raw_data()
+        if data:
+            # get_data rescales some values of data in place.
+            self.raw_data = dict(data)
+            self.raw_data_updated = dt_util.utcnow()
+            if self.recorder is not None:
+                self.recorder.record(self.raw_data)
+        return data
+
+
+class ReplayStove(pystove.Stove):
+    """A pystove Stove that returns recorded responses instead of polling."""
+
+    raw_data: dict[str, Any] | None = None
+    timestamp = 0.0
+
+    async def get_raw_data(self):
+        """Return a copy of the current recorded response.
+
+        get_data rescales some values in place, and any refresh during
+        the replay gets the same response.
+        """
+        return None if self.raw_data is None else dict(self.raw_data)
+
+    async def _get(self, url):
+        """Acknowledge any request without contacting a stove."""
+        return json.dumps({pystove.DATA_RESPONSE: pystove.RESPONSE_OK})
+
+    async def _post(self, url, data):
+        """Acknowledge any request without contacting a stove."""
+        return json.dumps({pystove.DATA_RESPONSE: pystove.RESPONSE_OK})
+
+
+class TraceWriter:
+    """Append raw stove responses to a trace file."""
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the trace writer."""
+        self.hass = hass
+        self.path = path
+        self._file: IO[bytes] | None = None
+        self._pending: list[bytes] = []
+        self._flush_task: asyncio.Task | None = None
+        self._start = monotonic()
+
+    async def async_open(self) -> None:
+        """Open the trace file for appending."""
+        self._file = await self.hass.async_add_executor_job(gzip.open, self.path, "ab")
+        self._start = monotonic()
+
+    @callback
+    def record(self, raw_data: dict[str, Any]) -> None:
+        """Queue a raw response for writing."""
+        line = json.dumps(
+            [round(monotonic() - self._start, 3), raw_data], separators=(",", ":")
+        )
+        self._pending.append(line.encode() + b"\n")
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush(), f"hwam_stove trace {self.path}"
+            )
+
+    async def _async_flush(self) -> None:
+        """Write pending lines in order, one batch at a time."""
+        while self._pending and self._file is not None:
+            lines, self._pending = self._pending, []
+            await self.hass.async_add_executor_job(self._write, self._file, lines)
+        self._flush_task = None
+
+    @staticmethod
+    def _write(file: IO[bytes], lines: list[bytes]) -> None:
+        """Write lines and flush them to disk."""
+        file.writelines(lines)
+        file.flush()
+
+    async def async_close(self) -> None:
+        """Write remaining lines and close the trace file."""
+        if self._flush_task is not None:
+            await self._flush_task
+        if self._file is not None:
+            await self.hass.async_add_executor_job(self._file.close)
+            self._file = None
+
+
+def iter_trace(path: str) -> Iterator[tuple[float, dict[str, Any]]]:
+    """Yield (timestamp, raw response) tuples from a trace file."""
+    with gzip.open(path, "rt") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            timestamp, raw_data = json.loads(line)
+            yield timestamp, raw_data
+
+
+async def async_replay_trace(
+    hass: HomeAssistant, coordinator: StoveCoordinator, path: str, speed: float
+) -> int:
+    """Feed a trace through the coordinator, return the number of responses.
+
+    Delays between responses are divided by speed, a speed of 0 replays
+    without delays. The coordinator is connected to its stove again
+    afterwards, and refreshed unless the replay was cancelled.
+    """
+    original_stove = coordinator.stove
+    replay_stove = await ReplayStove.create(original_stove.stove_host, skip_ident=True)
+    replay_stove.series = original_stove.series
+    coordinator.stove = replay_stove
+
+    trace = iter_trace(path)
+    count = 0
+    previous: float | None = None
+    try:
+        while batch := await hass.async_add_executor_job(
+            list, islice(trace, REPLAY_BATCH_SIZE)
+        ):
+            for timestamp, raw_data in batch:
+                if speed and previous is not None:
+                    await asyncio.sleep(max(0.0, timestamp - previous) / speed)
+                previous = timestamp
+                replay_stove.raw_data = raw_data
+                replay_stove.timestamp = timestamp
+                await coordinator.async_refresh()
+                count += 1
+    finally:
+        # A cancelled replay may leave the trace being read in the executor.
+        if not trace.gi_running:
+            trace.close()
+        coordinator.stove = original_stove
+        await replay_stove.destroy()
+    await coordinator.async_request_refresh()
+
+    _LOGGER.debug("Replayed %d responses from %s", count, path)
+    return count
@@ -0,0 +1,130 @@
+"""Websocket API for the HWAM Stove integration."""
+
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+import voluptuous as vol
+
+from .const import ATTR_CONFIG_ENTRY_ID, DATA_STOVES, DOMAIN
+from .coordinator import StoveCoordinator
+
+ATTR_UPDATE_INTERVAL = "update_interval"
+
+MIN_UPDATE_INTERVAL = 2
+
+
+def compact_value(value: Any) -> Any:
+    """Return a JSON serializable representation of a stove data value."""
+    if isinstance(value, date | time):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+def compact_snapshot(data: dict[str, Any] | None) -> dict[str, Any]:
+    """Return a JSON serializable copy of the coordinator data."""
+    if data is None:
+        return {}
+    return {key: compact_value(value) for key, value in data.items()}
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the HWAM Stove websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional(ATTR_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=MIN_UPDATE_INTERVAL)
+        ),
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a stove snapshot, followed by the changed fields after each update.
+
+    An optional update interval makes the stove poll faster while the
+    subscription is active. The subscription follows reloads of the
+    entry, and ends with an error when the entry is not set up again.
+    """
+    stove_hub = (
+        hass.data.get(DOMAIN, {}).get(DATA_STOVES, {}).get(msg[ATTR_CONFIG_ENTRY_ID])
+    )
+    if stove_hub is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded"
+        )
+        return
+
+    sent = compact_snapshot(stove_hub.data)
+    available = stove_hub.last_update_success
+
+    @callback
+    def forward_update() -> None:
+        """Send the fields that changed since the last message."""
+        nonlocal available, sent
+        snapshot = compact_snapshot(stove_hub.data)
+        changed = {
+            key: value for key, value in snapshot.items() if sent.get(key) != value
+        }
+        if not changed and available == stove_hub.last_update_success:
+            return
+        sent = snapshot
+        available = stove_hub.last_update_success
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"available": available, "changed": changed}
+            )
+        )
+
+    unsubscribers: list[CALLBACK_TYPE] = []
+
+    @callback
+    def unsubscribe() -> None:
+        """Remove the subscription."""
+        for unsub in unsubscribers:
+            unsub()
+        unsubscribers.clear()
+
+    @callback
+    def bind(coordinator: StoveCoordinator | None) -> None:
+        """Subscribe to the coordinator of the entry, ending without one."""
+        nonlocal stove_hub
+        unsubscribe()
+        if coordinator is None:
+            connection.subscriptions.pop(msg["id"], None)
+            connection.send_error(
+                msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry unloaded"
+            )
+            return
+        stove_hub = coordinator
+        unsubscribers.append(stove_hub.async_add_listener(forward_update))
+        if (interval := msg.get(ATTR_UPDATE_INTERVAL)) is not None:
+            unsubscribers.append(
+                stove_hub.async_request_update_interval(timedelta(seconds=interval))
+            )
+        unsubscribers.append(stove_hub.async_add_subscription(bind))
+
+    bind(stove_hub)
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {"available": available, "snapshot": sent},
+        )
+    )
@@ -0,0 +1 @@
+"""Tests of the HWAM Stove integration."""
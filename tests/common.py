@@ -0,0 +1,75 @@
+"""Home Assistant running the HWAM Stove integration against simulated stoves."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import tempfile
+from typing import Any
+
+from homeassistant import auth, bootstrap, loader
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries, ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_MONITORED_VARIABLES, CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.hwam_stove.const import DATA_STOVES, DOMAIN
+from custom_components.hwam_stove.coordinator import StoveCoordinator
+
+
+@asynccontextmanager
+async def async_home_assistant() -> AsyncIterator[HomeAssistant]:
+    """Run Home Assistant with the integration set up, in a temporary config.
+
+    The HTTP server is not started, the integration only registers views.
+    """
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await loader.async_setup(hass)
+        hass.config_entries = ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        hass.auth = await auth.auth_manager_from_config(hass, [], [])
+        assert await async_setup_component(hass, DOMAIN, {})
+        try:
+            yield hass
+        finally:
+            # Removing the entries closes the stove connections.
+            for entry in hass.config_entries.async_entries(DOMAIN):
+                await hass.config_entries.async_remove(entry.entry_id)
+            await hass.async_stop(force=True)
+
+
+async def async_add_stove(
+    hass: HomeAssistant,
+    host: str,
+    name: str,
+    options: dict[str, Any] | None = None,
+) -> tuple[ConfigEntry, StoveCoordinator]:
+    """Add the stove at host through the config flow, return its coordinator.
+
+    All entities are monitored. Further options reload the entry.
+    """
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_USER},
+        data={CONF_NAME: name, CONF_HOST: host, CONF_MONITORED_VARIABLES: []},
+    )
+    entry: ConfigEntry = result["result"]
+    if options:
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, **options}
+        )
+    await hass.async_block_till_done()
+    return entry, hass.data[DOMAIN][DATA_STOVES][entry.entry_id]
+
+
+def get_entity_id(
+    hass: HomeAssistant, entry: ConfigEntry, platform: str, key: str
+) -> str:
+    """Return the entity id of the entity of entry for key on platform."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        platform, DOMAIN, f"{entry.entry_id}-{key}"
+    )
+    assert entity_id is not None
+    return entity_id
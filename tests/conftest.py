@@ -0,0 +1,32 @@
+"""Fixtures of the HWAM Stove tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from .common import async_home_assistant
+from .simulated_stove import StoveServer
+
+
+@pytest.fixture
+def stove_server() -> Iterator[StoveServer]:
+    """Serve simulated stoves for the test."""
+    server = StoveServer()
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture
+async def hass(stove_server: StoveServer) -> AsyncIterator[HomeAssistant]:
+    """Run Home Assistant with the integration set up.
+
+    It stops before the simulated stoves do.
+    """
+    async with async_home_assistant() as hass:
+        yield hass
@@ -0,0 +1,161 @@
+"""Load test of the HWAM Stove integration with many simulated stoves.
+
+Run from the repository root:
+
+    python -m tests.harness --stoves 1 10 100 --duration 60
+
+For every number of stoves, Home Assistant is started with that many
+simulated stoves and measured for duration seconds:
+
+- event loop lag: how late a callback scheduled every 50 ms runs,
+- CPU time of the event loop thread per stove poll,
+- memory allocated per stove, from tracemalloc during setup,
+- state writes per second,
+- poll jitter reported by the coordinators.
+
+The stoves are served from a separate thread, so their work does not
+count against Home Assistant's event loop.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from time import monotonic, thread_time
+import tracemalloc
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+
+from custom_components.hwam_stove.const import CONF_POLL_INTERVAL
+from custom_components.hwam_stove.metrics import RollingSamples
+
+from .common import async_add_stove, async_home_assistant
+from .simulated_stove import EventLoopLag, SimulatedStove, StoveServer
+
+SAMPLES = 1_000_000
+
+
+def _ms(value: float | None) -> str:
+    """Format seconds as milliseconds."""
+    return "-" if value is None else f"{value * 1000:.1f}"
+
+
+async def async_measure(
+    stoves: int, duration: float, poll_interval: int, latency: float
+) -> dict[str, Any]:
+    """Run Home Assistant with stoves simulated stoves and measure it."""
+    server = StoveServer()
+    server.start()
+    try:
+        hosts = [
+            await server.async_add_stove(SimulatedStove(latency)) for _ in range(stoves)
+        ]
+        tracemalloc.start()
+        async with async_home_assistant() as hass:
+            baseline = tracemalloc.get_traced_memory()[0]
+            coordinators = [
+                (
+                    await async_add_stove(
+                        hass,
+                        host,
+                        f"Stove {index}",
+                        {CONF_POLL_INTERVAL: poll_interval},
+                    )
+                )[1]
+                for index, host in enumerate(hosts)
+            ]
+            # Let every stove poll once before measuring its memory.
+            await asyncio.sleep(poll_interval)
+            await hass.async_block_till_done()
+            per_stove = (tracemalloc.get_traced_memory()[0] - baseline) / stoves
+            tracemalloc.stop()
+
+            state_writes = 0
+
+            @callback
+            def count_state_write(_event: Event) -> None:
+                """Count a state write."""
+                nonlocal state_writes
+                state_writes += 1
+
+            unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_write)
+            lag = EventLoopLag()
+            polls = sum(stove.polls for stove in server.stoves)
+            start, cpu_start = monotonic(), thread_time()
+            lag.start()
+            await asyncio.sleep(duration)
+            await lag.stop()
+            elapsed, cpu = monotonic() - start, thread_time() - cpu_start
+            polls = sum(stove.polls for stove in server.stoves) - polls
+            unsub()
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        server.stop()
+
+    lag_samples = RollingSamples(SAMPLES)
+    for sample in lag.samples:
+        lag_samples.add(sample)
+    jitter = RollingSamples(SAMPLES)
+    for coordinator in coordinators:
+        if (p95 := coordinator.poll_jitter.percentile(95)) is not None:
+            jitter.add(p95)
+    return {
+        "stoves": stoves,
+        "polls": polls,
+        "lag": lag_samples.as_dict(),
+        "cpu_per_poll": cpu / polls if polls else None,
+        "memory_per_stove": per_stove,
+        "state_writes_per_second": state_writes / elapsed,
+        "jitter_p95": jitter.percentile(50),
+        "jitter_p95_worst": jitter.percentile(100),
+    }
+
+
+def _print_results(results: list[dict[str, Any]]) -> None:
+    """Print the measurements as a table."""
+    print(
+        f"{'stoves':>6} {'polls':>6} {'lag p50':>8} {'lag p95':>8} "
+        f"{'lag p99':>8} {'lag max':>8} {'cpu/poll':>9} {'kB/stove':>9} "
+        f"{'writes/s':>9} {'jitter':>8} {'worst':>8}"
+    )
+    print(
+        f"{'':>6} {'':>6} {'(ms)':>8} {'(ms)':>8} {'(ms)':>8} {'(ms)':>8} "
+        f"{'(ms)':>9} {'':>9} {'':>9} {'p95 ms':>8} {'p95 ms':>8}"
+    )
+    for result in results:
+        lag = result["lag"]
+        print(
+            f"{result['stoves']:>6} {result['polls']:>6} {_ms(lag['p50']):>8} "
+            f"{_ms(lag['p95']):>8} {_ms(lag['p99']):>8} {_ms(lag['max']):>8} "
+            f"{_ms(result['cpu_per_poll']):>9} "
+            f"{result['memory_per_stove'] / 1024:>9.1f} "
+            f"{result['state_writes_per_second']:>9.1f} "
+            f"{_ms(result['jitter_p95']):>8} {_ms(result['jitter_p95_worst']):>8}"
+        )
+
+
+def main() -> None:
+    """Run the load test for every requested number of stoves."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stoves", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--poll-interval", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="stove response time (s)"
+    )
+    args = parser.parse_args()
+    _print_results(
+        [
+            asyncio.run(
+                async_measure(stoves, args.duration, args.poll_interval, args.latency)
+            )
+            for stoves in args.stoves
+        ]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Simulated HWAM Stove serving the stove's HTTP API on localhost."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import json
+import random
+import threading
+from time import monotonic
+from typing import Any
+
+from aiohttp import web
+
+from pystove import pystove
+
+VERSION_INFO = "<Info><Name>Sim-1.0</Name><StoveType>Simulated</StoveType></Info>"
+
+
+def _ok() -> web.Response:
+    """Return the stove's response to an accepted request."""
+    return web.json_response({pystove.DATA_RESPONSE: pystove.RESPONSE_OK})
+
+
+class SimulatedStove:
+    """A stove that answers pystove's requests from an in-memory state.
+
+    Temperatures drift on every poll, as they do on a burning stove.
+    Accepted writes are kept in order in writes, as (setting, value).
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize the stove state, answering after latency seconds."""
+        self.latency = latency
+        self.state: dict[str, Any] = {
+            pystove.DATA_ALGORITHM: "Sim-1.0",
+            pystove.DATA_BURN_LEVEL: 3,
+            pystove.DATA_MAINTENANCE_ALARMS: 0,
+            pystove.DATA_MESSAGE_ID: 0,
+            pystove.DATA_NEW_FIREWOOD_HOURS: 1,
+            pystove.DATA_NEW_FIREWOOD_MINUTES: 30,
+            pystove.DATA_NIGHT_BEGIN_HOUR: 22,
+            pystove.DATA_NIGHT_BEGIN_MINUTE: 0,
+            pystove.DATA_NIGHT_END_HOUR: 6,
+            pystove.DATA_NIGHT_END_MINUTE: 0,
+            pystove.DATA_NIGHT_LOWERING: 2,
+            pystove.DATA_OPERATION_MODE: 2,
+            pystove.DATA_OXYGEN_LEVEL: 1200,
+            pystove.DATA_PHASE: 2,
+            pystove.DATA_REFILL_ALARM: 0,
+            pystove.DATA_REMOTE_REFILL_ALARM: 0,
+            pystove.DATA_REMOTE_VERSION_BUILD: 0,
+            pystove.DATA_REMOTE_VERSION_MAJOR: 1,
+            pystove.DATA_REMOTE_VERSION_MINOR: 0,
+            pystove.DATA_ROOM_TEMPERATURE: 2100,
+            pystove.DATA_SAFETY_ALARMS: 0,
+            pystove.DATA_STOVE_TEMPERATURE: 30000,
+            pystove.DATA_TIME_SINCE_REMOTE_MSG: 1,
+            pystove.DATA_UPDATING: 0,
+            pystove.DATA_VALVE1_POSITION: 50,
+            pystove.DATA_VALVE2_POSITION: 50,
+            pystove.DATA_VALVE3_POSITION: 50,
+            pystove.DATA_FIRMWARE_VERSION_BUILD: 0,
+            pystove.DATA_FIRMWARE_VERSION_MAJOR: 1,
+            pystove.DATA_FIRMWARE_VERSION_MINOR: 0,
+        }
+        self.clock_offset = 0.0
+        self.failing_polls = 0
+        self.polls = 0
+        self.writes: list[tuple[str, Any]] = []
+        self.host: str | None = None
+        self._runner: web.AppRunner | None = None
+
+    async def async_start(self) -> str:
+        """Start serving on a free localhost port, return the stove host."""
+        app = web.Application()
+        app.router.add_get(pystove.STOVE_DATA_URL, self._get_data)
+        app.router.add_get(pystove.STOVE_ID_URL, self._get_identification)
+        app.router.add_get(pystove.STOVE_ACCESSPOINT_URL, self._get_accesspoint)
+        app.router.add_post(pystove.STOVE_OPEN_FILE_URL, self._open_file)
+        app.router.add_post(pystove.STOVE_READ_OPEN_FILE_URL, self._read_open_file)
+        app.router.add_post(pystove.STOVE_BURN_LEVEL_URL, self._set_burn_level)
+        app.router.add_get(
+            pystove.STOVE_NIGHT_LOWERING_ON_URL, self._set_night_lowering_on
+        )
+        app.router.add_get(
+            pystove.STOVE_NIGHT_LOWERING_OFF_URL, self._set_night_lowering_off
+        )
+        app.router.add_post(pystove.STOVE_NIGHT_TIME_URL, self._set_night_time)
+        app.router.add_post(
+            pystove.STOVE_REMOTE_REFILL_ALARM_URL, self._set_remote_refill_alarm
+        )
+        app.router.add_post(pystove.STOVE_SET_TIME_URL, self._set_time)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.host = f"127.0.0.1:{port}"
+        return self.host
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _respond(self) -> None:
+        """Wait for the simulated latency."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def lose_power(self) -> None:
+        """Restart the stove with its default settings and clock."""
+        self.state.update(
+            {
+                pystove.DATA_BURN_LEVEL: 3,
+                pystove.DATA_NIGHT_BEGIN_HOUR: 22,
+                pystove.DATA_NIGHT_BEGIN_MINUTE: 0,
+                pystove.DATA_NIGHT_END_HOUR: 6,
+                pystove.DATA_NIGHT_END_MINUTE: 0,
+                pystove.DATA_NIGHT_LOWERING: 0,
+                pystove.DATA_REMOTE_REFILL_ALARM: 0,
+            }
+        )
+        self.clock_offset = (
+            datetime(2000, 1, 1).timestamp() - datetime.now().timestamp()
+        )
+
+    async def _get_data(self, request: web.Request) -> web.Response:
+        """Return the raw stove data, with drifting temperatures.
+
+        Polls answer with an empty response while failing_polls is set.
+        """
+        await self._respond()
+        if self.failing_polls:
+            self.failing_polls -= 1
+            return web.Response(text="")
+        self.polls += 1
+        state = self.state
+        state[pystove.DATA_MESSAGE_ID] = (state[pystove.DATA_MESSAGE_ID] + 1) % 256
+        state[pystove.DATA_STOVE_TEMPERATURE] += random.randint(-300, 300)
+        state[pystove.DATA_OXYGEN_LEVEL] = 1200 + random.randint(-200, 200)
+        now = datetime.fromtimestamp(datetime.now().timestamp() + self.clock_offset)
+        return web.json_response(
+            {
+                **state,
+                pystove.DATA_YEAR: now.year,
+                pystove.DATA_MONTH: now.month,
+                pystove.DATA_DAY: now.day,
+                pystove.DATA_HOURS: now.hour,
+                pystove.DATA_MINUTES: now.minute,
+                pystove.DATA_SECONDS: now.second,
+            }
+        )
+
+    async def _get_identification(self, request: web.Request) -> web.Response:
+        """Return the stove identity."""
+        return web.json_response(
+            {
+                pystove.DATA_NAME: "Simulated",
+                pystove.DATA_IP: "127.0.0.1",
+                pystove.DATA_MDNS: "simulated",
+            }
+        )
+
+    async def _get_accesspoint(self, request: web.Request) -> web.Response:
+        """Return the access point of the stove."""
+        return web.json_response({pystove.DATA_SSID: "simulated"})
+
+    async def _open_file(self, request: web.Request) -> web.Response:
+        """Accept opening the version info file."""
+        return web.json_response({pystove.DATA_SUCCESS: 1})
+
+    async def _read_open_file(self, request: web.Request) -> web.Response:
+        """Return the version info file."""
+        return web.Response(text=VERSION_INFO)
+
+    async def _write(self, setting: str, value: Any) -> web.Response:
+        """Accept a write after the simulated latency."""
+        await self._respond()
+        self.writes.append((setting, value))
+        return _ok()
+
+    async def _set_burn_level(self, request: web.Request) -> web.Response:
+        """Set the burn level."""
+        level = json.loads(await request.text())[pystove.DATA_LEVEL]
+        self.state[pystove.DATA_BURN_LEVEL] = level
+        return await self._write(pystove.DATA_BURN_LEVEL, level)
+
+    async def _set_night_lowering_on(self, request: web.Request) -> web.Response:
+        """Enable night lowering."""
+        self.state[pystove.DATA_NIGHT_LOWERING] = 2
+        return await self._write(pystove.DATA_NIGHT_LOWERING, True)
+
+    async def _set_night_lowering_off(self, request: web.Request) -> web.Response:
+        """Disable night lowering."""
+        self.state[pystove.DATA_NIGHT_LOWERING] = 0
+        return await self._write(pystove.DATA_NIGHT_LOWERING, False)
+
+    async def _set_night_time(self, request: web.Request) -> web.Response:
+        """Set the night lowering hours."""
+        hours = json.loads(await request.text())
+        self.state[pystove.DATA_NIGHT_BEGIN_HOUR] = hours[pystove.DATA_BEGIN_HOUR]
+        self.state[pystove.DATA_NIGHT_BEGIN_MINUTE] = hours[pystove.DATA_BEGIN_MINUTE]
+        self.state[pystove.DATA_NIGHT_END_HOUR] = hours[pystove.DATA_END_HOUR]
+        self.state[pystove.DATA_NIGHT_END_MINUTE] = hours[pystove.DATA_END_MINUTE]
+        return await self._write(
+            "night_lowering_hours",
+            (
+                hours[pystove.DATA_BEGIN_HOUR],
+                hours[pystove.DATA_BEGIN_MINUTE],
+                hours[pystove.DATA_END_HOUR],
+                hours[pystove.DATA_END_MINUTE],
+            ),
+        )
+
+    async def _set_remote_refill_alarm(self, request: web.Request) -> web.Response:
+        """Set the remote refill alarm."""
+        enable = json.loads(await request.text())[pystove.DATA_ENABLE]
+        self.state[pystove.DATA_REMOTE_REFILL_ALARM] = enable
+        return await self._write(pystove.DATA_REMOTE_REFILL_ALARM, bool(enable))
+
+    async def _set_time(self, request: web.Request) -> web.Response:
+        """Set the stove clock."""
+        values = json.loads(await request.text())
+        stove_time = datetime(
+            values["year"],
+            values["month"] + 1,
+            values["day"],
+            values["hours"],
+            values["minutes"],
+            values["seconds"],
+        )
+        self.clock_offset = stove_time.timestamp() - datetime.now().timestamp()
+        return await self._write(pystove.DATA_DATE_TIME, stove_time)
+
+
+class StoveServer:
+    """Serve simulated stoves from their own event loop in a thread.
+
+    Keeps the work of the stoves off the event loop of Home Assistant,
+    so only the integration is measured there.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the server loop."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self.stoves: list[SimulatedStove] = []
+
+    def start(self) -> None:
+        """Start the server thread."""
+        self._thread.start()
+
+    async def async_add_stove(self, stove: SimulatedStove) -> str:
+        """Start serving stove, return its host."""
+        self.stoves.append(stove)
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(stove.async_start(), self._loop)
+        )
+
+    def stop(self) -> None:
+        """Stop all stoves and the server thread."""
+
+        async def stop_stoves() -> None:
+            """Stop all stoves."""
+            await asyncio.gather(*(stove.async_stop() for stove in self.stoves))
+
+        asyncio.run_coroutine_threadsafe(stop_stoves(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class EventLoopLag:
+    """Measure how late the event loop runs a callback scheduled at interval."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        """Initialize the probe."""
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start probing the running event loop."""
+        self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _probe(self) -> None:
+        """Sleep for interval and record how much later the loop woke up."""
+        while True:
+            start = monotonic()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, monotonic() - start - self.interval))
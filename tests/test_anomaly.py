@@ -0,0 +1,50 @@
+"""Tests of the early warnings from HWAM Stove telemetry."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from custom_components.hwam_stove.anomaly import (
+    VALVE_KEYS,
+    WARNING_VALVE_PROBLEM,
+    AnomalyDetector,
+)
+from pystove import pystove
+
+
+def _sample(phase: int, valve_position: int) -> dict[str, Any]:
+    """Return stove data with all valves at valve_position."""
+    return {
+        pystove.DATA_PHASE: pystove.PHASE[phase],
+        pystove.DATA_STOVE_TEMPERATURE: 250,
+        pystove.DATA_OXYGEN_LEVEL: 12,
+        **dict.fromkeys(VALVE_KEYS, valve_position),
+    }
+
+
+def test_valves_move_with_phase() -> None:
+    """Test that valves moving at a phase change are no valve problem."""
+    detector = AnomalyDetector()
+    time = 0
+    for _ in range(10):
+        time += 60
+        assert detector.update(time, _sample(2, 80)) == []
+
+    # The valves close over a few samples when the glow phase starts.
+    for position in (50, 20):
+        time += 60
+        assert detector.update(time, _sample(4, position)) == []
+    for _ in range(10):
+        time += 60
+        assert detector.update(time, _sample(4, 20)) == []
+
+    # Valves jumping within a phase are still a problem.
+    time += 60
+    assert WARNING_VALVE_PROBLEM in detector.update(time, _sample(4, 90))
+
+
+def test_valve_position_out_of_range_while_settling() -> None:
+    """Test that impossible valve positions are reported at a phase change."""
+    detector = AnomalyDetector()
+    detector.update(60, _sample(2, 80))
+    assert WARNING_VALVE_PROBLEM in detector.update(120, _sample(4, 120))
@@ -0,0 +1,56 @@
+"""Tests of the backoff of an unreachable HWAM Stove."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+import pytest
+
+from custom_components.hwam_stove.budget import RequestBudget
+from custom_components.hwam_stove.const import CONF_POLL_INTERVAL
+from custom_components.hwam_stove.coordinator import BACKOFF_MAX
+
+from .common import async_add_stove
+from .simulated_stove import SimulatedStove, StoveServer
+
+FAILURES = 60
+
+
+async def test_backoff_after_many_failures(
+    hass: HomeAssistant, stove_server: StoveServer, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the backoff stays capped however long the stove is away."""
+    stove = SimulatedStove()
+    _, coordinator = await async_add_stove(
+        hass,
+        await stove_server.async_add_stove(stove),
+        "Stove",
+        {CONF_POLL_INTERVAL: 3600},
+    )
+    # The request budget is not under test here.
+    coordinator.budget = RequestBudget(1000, 1000, 1000)
+    stove.failing_polls = FAILURES
+    with caplog.at_level(logging.ERROR):
+        for _ in range(FAILURES):
+            await coordinator.async_refresh()
+            assert isinstance(coordinator.last_exception, UpdateFailed)
+            assert not coordinator.circuit_open or (
+                coordinator.update_interval <= BACKOFF_MAX
+            )
+
+    assert coordinator.as_dict()["consecutive_failures"] == FAILURES
+    assert coordinator.update_interval >= BACKOFF_MAX / 2
+    # Only the first failure is logged as an error.
+    errors = [
+        record.getMessage()
+        for record in caplog.records
+        if not record.name.startswith("pystove")
+    ]
+    assert len(errors) == 1, errors
+    assert "Unexpected" not in errors[0]
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert not coordinator.circuit_open
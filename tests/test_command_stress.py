@@ -0,0 +1,153 @@
+"""Stress test of stove commands interleaved with polls."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import time
+import logging
+import random
+
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import HomeAssistant
+
+from custom_components.hwam_stove.budget import RequestBudget
+from custom_components.hwam_stove.const import CONF_POLL_INTERVAL
+from custom_components.hwam_stove.coordinator import StoveCoordinator
+from pystove import pystove
+
+from .common import async_add_stove, get_entity_id
+from .simulated_stove import SimulatedStove, StoveServer
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMANDS_PER_SETTING = 40
+STOVE_LATENCY = 0.01
+
+
+async def _async_write_burn_levels(
+    hass: HomeAssistant, entity_id: str, levels: list[int]
+) -> None:
+    """Set the burn levels one after another."""
+    for level in levels:
+        await hass.services.async_call(
+            Platform.NUMBER,
+            "set_value",
+            {ATTR_ENTITY_ID: entity_id, "value": level},
+            blocking=True,
+        )
+        await asyncio.sleep(random.uniform(0, STOVE_LATENCY))
+
+
+async def _async_write_switch(
+    hass: HomeAssistant, entity_id: str, states: list[bool]
+) -> None:
+    """Switch on and off one after another."""
+    for state in states:
+        await hass.services.async_call(
+            Platform.SWITCH,
+            "turn_on" if state else "turn_off",
+            {ATTR_ENTITY_ID: entity_id},
+            blocking=True,
+        )
+        await asyncio.sleep(random.uniform(0, STOVE_LATENCY))
+
+
+async def _async_write_times(
+    hass: HomeAssistant, entity_id: str, times: list[time]
+) -> None:
+    """Set the times one after another."""
+    for value in times:
+        await hass.services.async_call(
+            Platform.TIME,
+            "set_value",
+            {ATTR_ENTITY_ID: entity_id, "time": value},
+            blocking=True,
+        )
+        await asyncio.sleep(random.uniform(0, STOVE_LATENCY))
+
+
+async def _async_poll(coordinator: StoveCoordinator, polls: int) -> None:
+    """Poll the stove in between the commands."""
+    for _ in range(polls):
+        await coordinator.async_refresh()
+        await asyncio.sleep(random.uniform(0, 3 * STOVE_LATENCY))
+
+
+async def test_interleaved_commands_and_polls(
+    hass: HomeAssistant, stove_server: StoveServer
+) -> None:
+    """Test that commands racing polls are neither lost nor reordered."""
+    stove = SimulatedStove(STOVE_LATENCY)
+    host = await stove_server.async_add_stove(stove)
+    entry, coordinator = await async_add_stove(
+        hass, host, "Stove", {CONF_POLL_INTERVAL: 5}
+    )
+    # The request budget is not under test here.
+    coordinator.budget = RequestBudget(1000, 1000, 1000)
+
+    levels = [index % 6 for index in range(1, COMMANDS_PER_SETTING + 1)]
+    refill_alarms = [index % 2 == 0 for index in range(COMMANDS_PER_SETTING)]
+    night_lowerings = [index % 2 == 1 for index in range(COMMANDS_PER_SETTING)]
+    begin_times = [time(20, index % 60) for index in range(1, COMMANDS_PER_SETTING + 1)]
+    await asyncio.gather(
+        _async_write_burn_levels(
+            hass,
+            get_entity_id(hass, entry, Platform.NUMBER, pystove.DATA_BURN_LEVEL),
+            levels,
+        ),
+        _async_write_switch(
+            hass,
+            get_entity_id(
+                hass, entry, Platform.SWITCH, pystove.DATA_REMOTE_REFILL_ALARM
+            ),
+            refill_alarms,
+        ),
+        _async_write_switch(
+            hass,
+            get_entity_id(hass, entry, Platform.SWITCH, pystove.DATA_NIGHT_LOWERING),
+            night_lowerings,
+        ),
+        _async_write_times(
+            hass,
+            get_entity_id(hass, entry, Platform.TIME, pystove.DATA_NIGHT_BEGIN_TIME),
+            begin_times,
+        ),
+        _async_poll(coordinator, COMMANDS_PER_SETTING),
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    # Every command reached the stove, in the order it was sent.
+    writes: dict[str, list] = {}
+    for setting, value in stove.writes:
+        writes.setdefault(setting, []).append(value)
+    assert writes[pystove.DATA_BURN_LEVEL] == levels
+    assert writes[pystove.DATA_REMOTE_REFILL_ALARM] == refill_alarms
+    assert writes[pystove.DATA_NIGHT_LOWERING] == night_lowerings
+    assert [
+        time(begin_hour, begin_minute)
+        for begin_hour, begin_minute, _, _ in writes["night_lowering_hours"]
+    ] == begin_times
+
+    # The stove and the integration end up at the last command.
+    data = coordinator.data
+    assert data[pystove.DATA_BURN_LEVEL] == levels[-1]
+    assert bool(data[pystove.DATA_REMOTE_REFILL_ALARM]) == refill_alarms[-1]
+    assert (
+        data[pystove.DATA_NIGHT_LOWERING] != pystove.NIGHT_LOWERING_STATES[0]
+    ) == night_lowerings[-1]
+    assert data[pystove.DATA_NIGHT_BEGIN_TIME] == begin_times[-1]
+
+    round_trips = coordinator.command_round_trips.as_dict()
+    confirmed = coordinator.command_latency.as_dict()
+    _LOGGER.info(
+        "Command round trip p50 %.3f s, p99 %.3f s; confirmed p50 %.3f s, p99 %.3f s",
+        round_trips["p50"],
+        round_trips["p99"],
+        confirmed["p50"],
+        confirmed["p99"],
+    )
+    # Commands queue behind at most one request of every other writer
+    # and a poll, and are confirmed by the next poll.
+    assert round_trips["p99"] < 20 * STOVE_LATENCY + 1, round_trips
+    assert confirmed["p99"] < coordinator.request_timeout + 1, confirmed
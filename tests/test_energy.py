@@ -0,0 +1,33 @@
+"""Tests of the energy meter of a HWAM Stove."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hwam_stove.const import DATA_HEAT_ENERGY, DATA_WOOD_CONSUMPTION
+from custom_components.hwam_stove.energy import (
+    RATED_STOVE_TEMPERATURE,
+    STOVE_EFFICIENCY,
+    WOOD_ENERGY_DENSITY,
+    EnergyMeter,
+)
+from pystove import pystove
+
+RATED_DATA = {
+    pystove.DATA_PHASE: pystove.PHASE[2],
+    pystove.DATA_BURN_LEVEL: 5,
+    pystove.DATA_STOVE_TEMPERATURE: RATED_STOVE_TEMPERATURE,
+}
+
+
+def test_wood_burnt_for_delivered_heat() -> None:
+    """Test that the delivered heat takes more wood than its energy content."""
+    meter = EnergyMeter(8)
+    for minute in range(0, 61, 5):
+        meter.add(minute * 60, RATED_DATA)
+
+    assert meter.totals[DATA_HEAT_ENERGY] == pytest.approx(8)
+    # 8 kWh of heat at 80 % efficiency takes 10 kWh of wood.
+    assert meter.totals[DATA_WOOD_CONSUMPTION] * WOOD_ENERGY_DENSITY == (
+        pytest.approx(8 / STOVE_EFFICIENCY)
+    )
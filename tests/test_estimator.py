@@ -0,0 +1,30 @@
+"""Tests of the estimates of HWAM Stove values between polls."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hwam_stove.estimator import LinearTrend
+
+
+def _rising_trend(**kwargs: float) -> LinearTrend:
+    """Return a trend of a value rising by 30 per minute to 160."""
+    trend = LinearTrend(**kwargs)
+    for minute in range(3):
+        trend.add(minute * 60, 100 + minute * 30)
+    return trend
+
+
+def test_estimate_within_horizon() -> None:
+    """Test that the trend is followed up to the horizon."""
+    trend = _rising_trend(max_horizon=60, margin=100)
+
+    assert trend.estimate(150) == pytest.approx(175)
+    assert trend.estimate(720) == pytest.approx(190)
+
+
+def test_estimate_within_observed_range() -> None:
+    """Test that estimates stay within a margin of the observed values."""
+    trend = _rising_trend(max_horizon=600, margin=10)
+
+    assert trend.estimate(720) == pytest.approx(170)
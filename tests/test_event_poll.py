@@ -0,0 +1,36 @@
+"""Tests of the polls just after stove events."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hwam_stove.const import CONF_POLL_INTERVAL
+from pystove import pystove
+
+from .common import async_add_stove
+from .simulated_stove import SimulatedStove, StoveServer
+
+
+async def test_firewood_estimate_is_no_event(
+    hass: HomeAssistant, stove_server: StoveServer
+) -> None:
+    """Test that only night lowering schedules a poll of a burning stove."""
+    stove = SimulatedStove()
+    stove.state[pystove.DATA_NIGHT_LOWERING] = 0
+    _, coordinator = await async_add_stove(
+        hass,
+        await stove_server.async_add_stove(stove),
+        "Stove",
+        {CONF_POLL_INTERVAL: 3600},
+    )
+    next_events: dict[int, list] = {0: [], 2: []}
+    for night_lowering, events in next_events.items():
+        stove.state[pystove.DATA_NIGHT_LOWERING] = night_lowering
+        for minutes in range(20, 25):
+            stove.state[pystove.DATA_NEW_FIREWOOD_MINUTES] = minutes
+            await coordinator.async_refresh()
+            events.append(coordinator.as_dict()["next_event"])
+
+    assert next_events[0] == [None] * 5
+    assert len(set(next_events[2])) == 1
+    assert next_events[2][0].endswith(("T22:00:00", "T06:00:00"))
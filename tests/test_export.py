@@ -0,0 +1,53 @@
+"""Tests of the HWAM Stove history export."""
+
+from __future__ import annotations
+
+import csv
+from datetime import timedelta
+import os
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import recorder
+from homeassistant.setup import async_setup_component
+
+from custom_components.hwam_stove.export import EXPORT_CHUNK, async_export_history
+
+ENTITY_ID = "sensor.stove_phase"
+
+
+async def _async_record(hass: HomeAssistant, state: str) -> None:
+    """Set a state and wait until the recorder stored it."""
+    hass.states.async_set(ENTITY_ID, state)
+    await hass.async_block_till_done()
+    await get_instance(hass).async_block_till_done()
+
+
+async def test_export_keeps_state_at_chunk_boundary(hass: HomeAssistant) -> None:
+    """Test that a state recorded at a chunk boundary is exported once."""
+    # The recorder starts recording once Home Assistant is running.
+    hass.set_state(CoreState.running)
+    recorder.async_initialize_recorder(hass)
+    assert await async_setup_component(
+        hass,
+        "recorder",
+        {"recorder": {"commit_interval": 0}},
+    )
+    await _async_record(hass, "burn")
+    await _async_record(hass, "glow")
+    boundary = hass.states.get(ENTITY_ID).last_updated
+    await _async_record(hass, "standby")
+
+    path = os.path.join(hass.config.config_dir, "history.csv")
+    await async_export_history(
+        hass,
+        path,
+        [ENTITY_ID],
+        boundary - EXPORT_CHUNK,
+        boundary + timedelta(hours=1),
+    )
+    with open(path, encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    await get_instance(hass).async_block_till_done()
+
+    assert [state for _, _, state in rows[1:]] == ["burn", "glow", "standby"]
@@ -0,0 +1,109 @@
+"""Memory regression tests of a HWAM Stove."""
+
+from __future__ import annotations
+
+import logging
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hwam_stove.budget import RequestBudget
+from custom_components.hwam_stove.const import CONF_POLL_INTERVAL
+from custom_components.hwam_stove.coordinator import StoveCoordinator
+from pystove import pystove
+
+from .common import async_add_stove
+from .simulated_stove import SimulatedStove, StoveServer
+
+# Poll cycles that fill every rolling window before memory is compared.
+WARMUP_CYCLES = 150
+CYCLES = 300
+
+# Bytes allocated by setting up one stove, as traced by tracemalloc.
+STOVE_BUDGET = 1024 * 1024
+# Bytes of the structures of one stove reported by memory_usage().
+STRUCTURE_BUDGETS = {
+    "coordinator_bytes": 96 * 1024,
+    "snapshot_bytes": 8 * 1024,
+    "stove_bytes": 32 * 1024,
+    "entity_bytes": 512 * 1024,
+    "entity_bytes_max": 16 * 1024,
+}
+# Bytes the integration and pystove may keep after CYCLES more cycles.
+GROWTH_BUDGET = 16 * 1024
+# Bytes a structure may differ by between cycle counts, e.g. float sizes.
+STRUCTURE_TOLERANCE = 512
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACED_CODE = [
+    tracemalloc.Filter(True, "*/custom_components/hwam_stove/*"),
+    tracemalloc.Filter(True, f"{pystove.__file__.rpartition('/')[0]}/*"),
+]
+
+
+async def _async_cycle(coordinator: StoveCoordinator, cycles: int) -> None:
+    """Run poll cycles, with a burn level command in every one."""
+    for cycle in range(cycles):
+        await coordinator.async_send_command(
+            lambda level=cycle % 6: coordinator.stove.set_burn_level(level),
+            {pystove.DATA_BURN_LEVEL: cycle % 6},
+        )
+        await coordinator.async_refresh()
+        await coordinator.hass.async_block_till_done()
+
+
+async def test_memory(hass: HomeAssistant, stove_server: StoveServer) -> None:
+    """Test that a stove stays within budget and does not grow with polls."""
+    first_host = await stove_server.async_add_stove(SimulatedStove())
+    host = await stove_server.async_add_stove(SimulatedStove())
+    tracemalloc.start()
+    try:
+        # The first stove also loads the platforms and translations.
+        await async_add_stove(hass, first_host, "First stove")
+        await hass.async_block_till_done()
+        before_setup = tracemalloc.get_traced_memory()[0]
+        _, coordinator = await async_add_stove(
+            hass, host, "Stove", {CONF_POLL_INTERVAL: 3600}
+        )
+        await hass.async_block_till_done()
+        stove_bytes = tracemalloc.get_traced_memory()[0] - before_setup
+        after_setup = coordinator.memory_usage()
+        coordinator.budget = RequestBudget(1000, 1000, 1000)
+
+        await _async_cycle(coordinator, WARMUP_CYCLES)
+        warm = coordinator.memory_usage()
+        snapshot = tracemalloc.take_snapshot().filter_traces(TRACED_CODE)
+        await _async_cycle(coordinator, CYCLES)
+        cycled = coordinator.memory_usage()
+        growth = sum(
+            stat.size_diff
+            for stat in tracemalloc.take_snapshot()
+            .filter_traces(TRACED_CODE)
+            .compare_to(snapshot, "filename")
+        )
+    finally:
+        tracemalloc.stop()
+    _LOGGER.info(
+        "Stove %d bytes, %d bytes per entity; after setup %s, after %d cycles %s, "
+        "after %d cycles %s, growth %d bytes",
+        stove_bytes,
+        after_setup["entity_bytes"] // after_setup["entities"],
+        after_setup,
+        WARMUP_CYCLES,
+        warm,
+        WARMUP_CYCLES + CYCLES,
+        cycled,
+        growth,
+    )
+
+    assert stove_bytes < STOVE_BUDGET, f"setup allocated {stove_bytes} bytes"
+    for usage in (after_setup, warm, cycled):
+        for structure, budget in STRUCTURE_BUDGETS.items():
+            assert usage[structure] < budget, f"{structure}: {usage[structure]}"
+
+    for structure in STRUCTURE_BUDGETS:
+        assert cycled[structure] - warm[structure] < STRUCTURE_TOLERANCE, (
+            f"{structure} grew from {warm[structure]} to {cycled[structure]}"
+        )
+    assert growth < GROWTH_BUDGET, f"traced memory grew by {growth} bytes"
@@ -0,0 +1,58 @@
+"""Tests of the profiler of the HWAM Stove integration."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hwam_stove.const import CONF_POLL_INTERVAL, DATA_PROFILER, DOMAIN
+from custom_components.hwam_stove.profiler import async_start_profile
+
+from .common import async_add_stove
+from .simulated_stove import SimulatedStove, StoveServer
+
+
+async def test_profile_counts_polls(
+    hass: HomeAssistant, stove_server: StoveServer
+) -> None:
+    """Test that only polls count as profiled cycles."""
+    stove = SimulatedStove()
+    _, coordinator = await async_add_stove(
+        hass,
+        await stove_server.async_add_stove(stove),
+        "Stove",
+        {CONF_POLL_INTERVAL: 3600},
+    )
+    path = os.path.join(hass.config.config_dir, "cycles.prof")
+    async_start_profile(hass, coordinator, path, 2, 600)
+
+    # Estimates published between polls are no cycles.
+    for _ in range(5):
+        coordinator.async_update_listeners()
+    await coordinator.async_refresh()
+    assert DATA_PROFILER in hass.data[DOMAIN]
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert DATA_PROFILER not in hass.data[DOMAIN]
+    assert os.path.isfile(path)
+
+
+async def test_profile_duration(hass: HomeAssistant, stove_server: StoveServer) -> None:
+    """Test that a profile stops after its duration without polls."""
+    stove = SimulatedStove()
+    _, coordinator = await async_add_stove(
+        hass,
+        await stove_server.async_add_stove(stove),
+        "Stove",
+        {CONF_POLL_INTERVAL: 3600},
+    )
+    path = os.path.join(hass.config.config_dir, "duration.prof")
+    async_start_profile(hass, coordinator, path, 1000, 0.1)
+
+    await asyncio.sleep(0.2)
+    await hass.async_block_till_done()
+    assert DATA_PROFILER not in hass.data[DOMAIN]
+    assert os.path.isfile(path)
@@ -0,0 +1,162 @@
+"""Tests of replaying traces of a HWAM Stove."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+
+from custom_components.hwam_stove.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_FILENAME,
+    ATTR_SPEED,
+    CONF_POLL_INTERVAL,
+    CONF_STOVE_RATING,
+    DATA_STOVES,
+    DOMAIN,
+    EVENT_HWAM_STOVE,
+    SERVICE_REPLAY_TRACE,
+)
+from custom_components.hwam_stove.trace import RecordingStove, async_replay_trace
+from pystove import pystove
+
+from .common import async_add_stove, get_entity_id
+from .simulated_stove import SimulatedStove, StoveServer
+
+
+async def test_replay_has_no_side_effects(
+    hass: HomeAssistant, stove_server: StoveServer
+) -> None:
+    """Test that a replayed trace changes nothing of the stove or its state."""
+    stove = SimulatedStove()
+    host = await stove_server.async_add_stove(stove)
+    entry, coordinator = await async_add_stove(
+        hass,
+        host,
+        "Stove",
+        {CONF_POLL_INTERVAL: 3600, CONF_STOVE_RATING: 8},
+    )
+    stove.clock_offset = 3600
+    path = os.path.join(hass.config.config_dir, "trace.jsonl.gz")
+    await coordinator.async_start_capture(path)
+    for phase in (2, 3, 4, 2):
+        stove.state[pystove.DATA_PHASE] = phase
+        await coordinator.async_refresh()
+    await coordinator.async_stop_capture()
+
+    # The burn level is set after the capture, so the trace has another.
+    await hass.services.async_call(
+        Platform.NUMBER,
+        "set_value",
+        {
+            ATTR_ENTITY_ID: get_entity_id(
+                hass, entry, Platform.NUMBER, pystove.DATA_BURN_LEVEL
+            ),
+            "value": 5,
+        },
+        blocking=True,
+    )
+    await coordinator.async_refresh()
+    burn_level_key = f"{Platform.NUMBER}.{pystove.DATA_BURN_LEVEL}"
+    assert coordinator.applied_settings[burn_level_key][0] == 5
+
+    # The recorded clock is off, which a live poll would correct.
+    stove.clock_offset = 0
+    coordinator.clock_drift_threshold = 60
+    events: list[Event] = []
+
+    @callback
+    def record_event(event: Event) -> None:
+        """Record a stove event."""
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_HWAM_STOVE, record_event)
+
+    def state() -> tuple:
+        """Return the state a replay must not change."""
+        return (
+            dict(coordinator.energy_meter.totals),
+            vars(coordinator.anomaly_detector.stove_temperature).copy(),
+            len(coordinator.round_trips),
+        )
+
+    before = state()
+    replayed_states: list[tuple] = []
+
+    @callback
+    def record_state() -> None:
+        """Record the state after every replayed poll."""
+        if coordinator.replaying:
+            replayed_states.append(state())
+
+    remove_listener = coordinator.async_add_listener(record_state)
+    writes = len(stove.writes)
+    assert await async_replay_trace(hass, coordinator, path, 0) == 4
+    await hass.async_block_till_done()
+    remove_listener()
+
+    assert events == []
+    assert stove.writes[writes:] == []
+    assert replayed_states == [before] * 4
+    # The replayed burn level did not undo the setting.
+    assert coordinator.applied_settings[burn_level_key][0] == 5
+    assert coordinator.reapplied_settings == 0
+
+    # Replaying did not count as a clock sync, so the clock is
+    # synchronized as soon as it is off.
+    stove.clock_offset = 3600
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert [setting for setting, _ in stove.writes[writes:]] == [pystove.DATA_DATE_TIME]
+
+
+async def test_replay_one_at_a_time(
+    hass: HomeAssistant, stove_server: StoveServer
+) -> None:
+    """Test that a second replay is refused and a reload ends the replay."""
+    stove = SimulatedStove()
+    entry, coordinator = await async_add_stove(
+        hass,
+        await stove_server.async_add_stove(stove),
+        "Stove",
+        {CONF_POLL_INTERVAL: 3600},
+    )
+    os.makedirs(hass.config.path(DOMAIN))
+    await coordinator.async_start_capture(hass.config.path(DOMAIN, "trace.jsonl.gz"))
+    for _ in range(3):
+        await coordinator.async_refresh()
+        await asyncio.sleep(0.1)
+    await coordinator.async_stop_capture()
+
+    # Slowed down, the replay waits long between responses.
+    replay = {
+        ATTR_CONFIG_ENTRY_ID: entry.entry_id,
+        ATTR_FILENAME: "trace.jsonl.gz",
+        ATTR_SPEED: 0.001,
+    }
+    await hass.services.async_call(DOMAIN, SERVICE_REPLAY_TRACE, replay, blocking=True)
+    while not coordinator.replaying:
+        await asyncio.sleep(0.01)
+    # Refreshes in between replayed responses get the same response.
+    await coordinator.async_refresh()
+    temperature = coordinator.data[pystove.DATA_STOVE_TEMPERATURE]
+    await coordinator.async_refresh()
+    assert coordinator.data[pystove.DATA_STOVE_TEMPERATURE] == temperature
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REPLAY_TRACE, replay, blocking=True
+        )
+
+    await hass.config_entries.async_reload(entry.entry_id)
+    reloaded = hass.data[DOMAIN][DATA_STOVES][entry.entry_id]
+    assert not coordinator.replaying
+    assert coordinator.replay_task is None
+    assert isinstance(reloaded.stove, RecordingStove)
+    polls = stove.polls
+    await reloaded.async_refresh()
+    assert reloaded.last_update_success
+    assert stove.polls == polls + 1
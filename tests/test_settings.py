@@ -0,0 +1,211 @@
+"""Tests of the settings written to a HWAM Stove."""
+
+from __future__ import annotations
+
+from datetime import time
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.hwam_stove.budget import RequestBudget, RequestBudgetExceeded
+from custom_components.hwam_stove.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_POLL_INTERVAL,
+    DATA_STOVES,
+    DOMAIN,
+    SERVICE_APPLY_SETTINGS,
+)
+from custom_components.hwam_stove.coordinator import StoveCoordinator
+from pystove import pystove
+
+from .common import async_add_stove, get_entity_id
+from .simulated_stove import SimulatedStove, StoveServer
+
+BURN_LEVEL_KEY = f"{Platform.NUMBER}.{pystove.DATA_BURN_LEVEL}"
+
+
+@pytest.fixture
+def stove() -> SimulatedStove:
+    """Return a simulated stove."""
+    return SimulatedStove()
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, stove_server: StoveServer, stove: SimulatedStove
+) -> StoveCoordinator:
+    """Set up the simulated stove with its burn level set to 5."""
+    entry, coordinator = await async_add_stove(
+        hass,
+        await stove_server.async_add_stove(stove),
+        "Stove",
+        {CONF_POLL_INTERVAL: 3600},
+    )
+    await hass.services.async_call(
+        Platform.NUMBER,
+        "set_value",
+        {
+            ATTR_ENTITY_ID: get_entity_id(
+                hass, entry, Platform.NUMBER, pystove.DATA_BURN_LEVEL
+            ),
+            "value": 5,
+        },
+        blocking=True,
+    )
+    await coordinator.async_refresh()
+    return coordinator
+
+
+async def _async_refresh(hass: HomeAssistant, coordinator: StoveCoordinator) -> None:
+    """Poll the stove and wait for the commands it caused."""
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+
+async def _async_apply_settings(
+    hass: HomeAssistant, coordinator: StoveCoordinator, **settings: Any
+) -> None:
+    """Apply settings to the stove through the apply_settings service."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        {ATTR_CONFIG_ENTRY_ID: coordinator.config_entry.entry_id, **settings},
+        blocking=True,
+    )
+
+
+async def test_confirmed_setting(
+    hass: HomeAssistant, coordinator: StoveCoordinator
+) -> None:
+    """Test that a confirmed setting no longer awaits confirmation."""
+    assert BURN_LEVEL_KEY not in coordinator.desired_settings
+    assert coordinator.applied_settings[BURN_LEVEL_KEY][0] == 5
+
+    await hass.config_entries.async_reload(coordinator.config_entry.entry_id)
+    reloaded = hass.data[DOMAIN][DATA_STOVES][coordinator.config_entry.entry_id]
+    assert reloaded is not coordinator
+    assert reloaded.applied_settings[BURN_LEVEL_KEY][0] == 5
+
+
+async def test_reapply_after_power_loss(
+    hass: HomeAssistant, coordinator: StoveCoordinator, stove: SimulatedStove
+) -> None:
+    """Test that settings are re-applied when the stove lost power."""
+    stove.lose_power()
+    await _async_refresh(hass, coordinator)
+    await _async_refresh(hass, coordinator)
+
+    assert stove.writes == [
+        (pystove.DATA_BURN_LEVEL, 5),
+        (pystove.DATA_BURN_LEVEL, 5),
+    ]
+    assert coordinator.data[pystove.DATA_BURN_LEVEL] == 5
+    assert coordinator.reapplied_settings == 1
+
+
+async def test_reapply_night_lowering_hours(
+    hass: HomeAssistant, coordinator: StoveCoordinator, stove: SimulatedStove
+) -> None:
+    """Test that both night lowering hours are re-applied after a power loss."""
+    for key, value in (
+        (pystove.DATA_NIGHT_BEGIN_TIME, time(21, 30)),
+        (pystove.DATA_NIGHT_END_TIME, time(7, 15)),
+    ):
+        await hass.services.async_call(
+            Platform.TIME,
+            "set_value",
+            {
+                ATTR_ENTITY_ID: get_entity_id(
+                    hass, coordinator.config_entry, Platform.TIME, key
+                ),
+                "time": value,
+            },
+            blocking=True,
+        )
+    await _async_refresh(hass, coordinator)
+    stove.lose_power()
+    await _async_refresh(hass, coordinator)
+    await _async_refresh(hass, coordinator)
+
+    assert (
+        stove.state[pystove.DATA_NIGHT_BEGIN_HOUR],
+        stove.state[pystove.DATA_NIGHT_BEGIN_MINUTE],
+        stove.state[pystove.DATA_NIGHT_END_HOUR],
+        stove.state[pystove.DATA_NIGHT_END_MINUTE],
+    ) == (21, 30, 7, 15)
+    assert coordinator.data[pystove.DATA_NIGHT_BEGIN_TIME] == time(21, 30)
+    assert coordinator.data[pystove.DATA_NIGHT_END_TIME] == time(7, 15)
+    assert {
+        f"{Platform.TIME}.{pystove.DATA_NIGHT_BEGIN_TIME}",
+        f"{Platform.TIME}.{pystove.DATA_NIGHT_END_TIME}",
+    } <= coordinator.applied_settings.keys()
+
+
+async def test_no_reapply_after_failed_poll(
+    hass: HomeAssistant, coordinator: StoveCoordinator, stove: SimulatedStove
+) -> None:
+    """Test that a setting changed at the stove is kept after a failed poll."""
+    stove.failing_polls = 1
+    await _async_refresh(hass, coordinator)
+    assert not coordinator.last_update_success
+    stove.state[pystove.DATA_BURN_LEVEL] = 2
+    await _async_refresh(hass, coordinator)
+
+    assert stove.writes == [(pystove.DATA_BURN_LEVEL, 5)]
+    assert coordinator.data[pystove.DATA_BURN_LEVEL] == 2
+    assert BURN_LEVEL_KEY not in coordinator.applied_settings
+
+
+async def test_apply_settings_follows_pending_write(
+    hass: HomeAssistant, coordinator: StoveCoordinator, stove: SimulatedStove
+) -> None:
+    """Test that applied settings are compared with unconfirmed writes."""
+    # The poll confirming the write of burn level 2 fails.
+    stove.failing_polls = 1
+    await coordinator.async_write_setting(
+        BURN_LEVEL_KEY, 2, lambda: coordinator.stove.set_burn_level(2)
+    )
+    assert coordinator.data[pystove.DATA_BURN_LEVEL] == 5
+    await _async_apply_settings(hass, coordinator, burn_level=5)
+
+    assert stove.writes[-1] == (pystove.DATA_BURN_LEVEL, 5)
+    assert stove.state[pystove.DATA_BURN_LEVEL] == 5
+
+
+async def test_reapply_applied_settings(
+    hass: HomeAssistant, coordinator: StoveCoordinator, stove: SimulatedStove
+) -> None:
+    """Test that settings applied at once are re-applied after a power loss."""
+    await _async_apply_settings(
+        hass,
+        coordinator,
+        burn_level=2,
+        night_begin_time="21:30",
+        remote_refill_alarm=True,
+    )
+    await _async_refresh(hass, coordinator)
+    stove.lose_power()
+    await _async_refresh(hass, coordinator)
+    await _async_refresh(hass, coordinator)
+
+    assert stove.state[pystove.DATA_BURN_LEVEL] == 2
+    assert stove.state[pystove.DATA_NIGHT_BEGIN_HOUR] == 21
+    assert stove.state[pystove.DATA_NIGHT_BEGIN_MINUTE] == 30
+    assert stove.state[pystove.DATA_REMOTE_REFILL_ALARM] == 1
+    assert coordinator.data[pystove.DATA_NIGHT_BEGIN_TIME] == time(21, 30)
+
+
+async def test_apply_settings_refreshes_after_dropped_command(
+    hass: HomeAssistant, coordinator: StoveCoordinator, stove: SimulatedStove
+) -> None:
+    """Test that a batch cut short by the request budget still refreshes."""
+    coordinator.budget = RequestBudget(10, 1, 0)
+    with pytest.raises(RequestBudgetExceeded):
+        await _async_apply_settings(
+            hass, coordinator, burn_level=2, remote_refill_alarm=True
+        )
+
+    assert stove.writes[-1] == (pystove.DATA_BURN_LEVEL, 2)
+    assert coordinator.data[pystove.DATA_BURN_LEVEL] == 2
@@ -0,0 +1,72 @@
+"""Tests of the HWAM Stove websocket API."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.core import HomeAssistant
+
+from custom_components.hwam_stove.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_POLL_INTERVAL,
+    DATA_STOVES,
+    DOMAIN,
+)
+from pystove import pystove
+
+from .common import async_add_stove
+from .simulated_stove import SimulatedStove, StoveServer
+
+
+async def test_subscription_follows_reload(
+    hass: HomeAssistant, stove_server: StoveServer
+) -> None:
+    """Test that a subscription survives a reload and ends with its entry."""
+    stove = SimulatedStove()
+    host = await stove_server.async_add_stove(stove)
+    entry, coordinator = await async_add_stove(
+        hass, host, "Stove", {CONF_POLL_INTERVAL: 3600}
+    )
+    user = await hass.auth.async_create_system_user("Websocket")
+    messages: list[dict[str, Any]] = []
+    connection = ActiveConnection(
+        logging.getLogger(__name__),
+        hass,
+        messages.append,
+        user,
+        await hass.auth.async_create_refresh_token(user),
+    )
+    connection.async_handle(
+        {
+            "id": 1,
+            "type": f"{DOMAIN}/subscribe",
+            ATTR_CONFIG_ENTRY_ID: entry.entry_id,
+        }
+    )
+    await hass.async_block_till_done()
+    assert [message["type"] for message in messages] == ["result", "event"]
+    assert messages[1]["event"]["snapshot"]
+
+    await hass.config_entries.async_reload(entry.entry_id)
+    reloaded = hass.data[DOMAIN][DATA_STOVES][entry.entry_id]
+    assert reloaded is not coordinator
+    del messages[:]
+
+    # Updates of the reloaded entry reach the subscription.
+    stove.state[pystove.DATA_PHASE] = 4
+    await reloaded.async_refresh()
+    await hass.async_block_till_done()
+    assert len(messages) == 1
+    assert messages[0]["event"]["changed"][pystove.DATA_PHASE] == "Glow"
+    assert 1 in connection.subscriptions
+    del messages[:]
+
+    # The subscription ends once the entry is gone.
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert [(message["type"], message["success"]) for message in messages] == [
+        ("result", False)
+    ]
+    assert 1 not in connection.subscriptions